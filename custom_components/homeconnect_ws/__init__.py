@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Never
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Never
 
+import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DESCRIPTION
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.const import CONF_DESCRIPTION, Platform
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
@@ -18,19 +20,42 @@ from homeassistant.helpers.device_registry import (
 from homeassistant.util.hass_dict import HassKey
 from homeconnect_websocket import CodeResponsError, Entity
 
+from .batcher import WriteBatcher
 from .const import (
+    CONF_COMPACT_DESCRIPTION,
+    CONF_DESCRIPTION_COMPACTED,
+    CONF_DESCRIPTION_HASH,
     CONF_DEV_OVERRIDE_HOST,
     CONF_DEV_OVERRIDE_PSK,
     CONF_DEV_SETUP_FROM_DUMP,
+    CONF_OPTIMISTIC,
+    DESCRIPTION_PLATFORMS,
     DOMAIN,
     PLATFORMS,
 )
 from .coordinator import HomeConnectCoordinator
+from .discovery import DiscoveryAggregator
+from .entity import OptimisticStats
 from .entity_descriptions import get_available_entities
-from .helpers import error_decorator, get_config_entry_from_call
+from .helpers import (
+    compact_description,
+    error_decorator,
+    fan_out_service,
+    get_options_or_raise,
+    get_program_or_raise,
+    get_referenced_entities,
+)
+from .reconciler import EntityReconciler
+from .scheduler import Priority, RequestScheduler
+from .snapshot import ValueSnapshot
+from .storage import (
+    async_load_description,
+    async_remove_unused_description,
+    async_save_description,
+)
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+    from homeassistant.core import HomeAssistant, ServiceCall
     from homeassistant.helpers.typing import ConfigType
     from homeconnect_websocket import HomeAppliance
 
@@ -44,11 +69,22 @@ CONFIG_SCHEMA = vol.Schema(
             vol.Optional(CONF_DEV_SETUP_FROM_DUMP, default=False): vol.Boolean(),
             vol.Optional(CONF_DEV_OVERRIDE_HOST): str,
             vol.Optional(CONF_DEV_OVERRIDE_PSK): str,
+            vol.Optional(CONF_COMPACT_DESCRIPTION, default=False): vol.Boolean(),
+            vol.Optional(CONF_OPTIMISTIC, default=False): vol.Boolean(),
         }
     },
     extra=vol.ALLOW_EXTRA,
 )
 
+GET_VALUES_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("prefix", default=""): cv.string,
+        vol.Optional("since"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("epoch"): cv.string,
+    }
+)
+
 
 @dataclass
 class HCData:
@@ -58,6 +94,12 @@ class HCData:
     device_info: DeviceInfo
     available_entity_descriptions: _EntityDescriptionsType
     coordinator: HomeConnectCoordinator
+    platforms: list[Platform]
+    reconciler: EntityReconciler
+    batcher: WriteBatcher
+    scheduler: RequestScheduler
+    snapshot: ValueSnapshot
+    optimistic: OptimisticStats | None = None
 
 
 @dataclass
@@ -67,6 +109,9 @@ class HCConfig:
     setup_from_dump: bool = False
     override_host: str | None = None
     override_psk: str | None = None
+    compact_description: bool = False
+    optimistic: bool = False
+    discovery: DiscoveryAggregator = field(default_factory=DiscoveryAggregator)
 
 
 type HCConfigEntry = ConfigEntry[HCData]
@@ -81,6 +126,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass.data[HC_KEY].setup_from_dump = config[DOMAIN].get(CONF_DEV_SETUP_FROM_DUMP, False)
         hass.data[HC_KEY].override_host = config[DOMAIN].get(CONF_DEV_OVERRIDE_HOST)
         hass.data[HC_KEY].override_psk = config[DOMAIN].get(CONF_DEV_OVERRIDE_PSK)
+        hass.data[HC_KEY].compact_description = config[DOMAIN].get(CONF_COMPACT_DESCRIPTION, False)
+        hass.data[HC_KEY].optimistic = config[DOMAIN].get(CONF_OPTIMISTIC, False)
 
     def _get_entity_or_raise(appliance: HomeAppliance, key: str, error_key: str) -> Entity:
         entity = appliance.entities.get(key)
@@ -105,18 +152,30 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             translation_placeholders={"code": err.code, "resource": err.resource},
         ) from None
 
-    async def _set_value_or_raise(entity: Entity, relative_time_in_seconds: int) -> None:
+    async def _set_value_or_raise(
+        config_entry: HCConfigEntry, entity: Entity, relative_time_in_seconds: int
+    ) -> None:
         try:
-            await entity.set_value(relative_time_in_seconds)
+            await config_entry.runtime_data.scheduler.async_send(
+                Priority.PROGRAM, entity.set_value, relative_time_in_seconds
+            )
         except CodeResponsError as exc:
             _raise_start_error(exc)
 
     @error_decorator
-    async def handle_start_program(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
-
-        options = {}
+    async def start_program(config_entry: HCConfigEntry, call: ServiceCall) -> None:
         appliance = config_entry.runtime_data.appliance
+        program = (
+            get_program_or_raise(appliance, call.data["program"])
+            if "program" in call.data
+            else appliance.selected_program
+        )
+
+        options = get_options_or_raise(
+            appliance,
+            call.data.get("options", {}),
+            validate=program is None or program is appliance.selected_program,
+        )
         if "start_in" in call.data:
             entity = _get_entity_or_raise(
                 appliance, "BSH.Common.Option.StartInRelative", "start_in_not_available"
@@ -129,9 +188,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
             options[entity.uid] = _duration_to_seconds(call.data["finish_in"])
 
-        if appliance.selected_program:
+        if program:
             try:
-                await appliance.selected_program.start(options)
+                await config_entry.runtime_data.scheduler.async_send(
+                    Priority.PROGRAM, program.start, options
+                )
             except CodeResponsError as exc:
                 _raise_start_error(exc)
         else:
@@ -141,10 +202,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
 
     @error_decorator
-    async def handle_set_start_in(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
+    async def set_start_in(config_entry: HCConfigEntry, call: ServiceCall) -> None:
         appliance = config_entry.runtime_data.appliance
-        _set_value_or_raise(
+        await _set_value_or_raise(
+            config_entry,
             _get_entity_or_raise(
                 appliance, "BSH.Common.Option.StartInRelative", "start_in_not_available"
             ),
@@ -152,19 +213,39 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
 
     @error_decorator
-    async def handle_set_finish_in(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
+    async def set_finish_in(config_entry: HCConfigEntry, call: ServiceCall) -> None:
         appliance = config_entry.runtime_data.appliance
-        _set_value_or_raise(
+        await _set_value_or_raise(
+            config_entry,
             _get_entity_or_raise(
                 appliance, "BSH.Common.Option.FinishInRelative", "finish_in_not_available"
             ),
             _duration_to_seconds(call.data["finish_in"]),
         )
 
-    hass.services.async_register(DOMAIN, "start_program", handle_start_program)
-    hass.services.async_register(DOMAIN, "set_start_in", handle_set_start_in)
-    hass.services.async_register(DOMAIN, "set_finish_in", handle_set_finish_in)
+    async def get_values(config_entry: HCConfigEntry, call: ServiceCall) -> dict[str, Any]:
+        return config_entry.runtime_data.snapshot.async_get_values(
+            call.data["prefix"], call.data.get("since"), call.data.get("epoch")
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_values",
+        fan_out_service(hass, get_values),
+        schema=GET_VALUES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    for service, func in (
+        ("start_program", start_program),
+        ("set_start_in", set_start_in),
+        ("set_finish_in", set_finish_in),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            fan_out_service(hass, func),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
     return True
 
 
@@ -173,8 +254,13 @@ async def async_setup_entry(
     config_entry: HCConfigEntry,
 ) -> bool:
     """Set up this integration using config entry."""
-    _LOGGER.debug("Setting up %s", config_entry.data[CONF_DESCRIPTION]["info"].get("model"))
-    coordinator = HomeConnectCoordinator(hass, config_entry)
+    description = await async_load_description(hass, config_entry.data[CONF_DESCRIPTION_HASH])
+    if description is None:
+        # Re-uploading the profile file restores the description
+        msg = "Appliance description not found"
+        raise ConfigEntryAuthFailed(msg)
+    _LOGGER.debug("Setting up %s", description["info"].get("model"))
+    coordinator = HomeConnectCoordinator(hass, config_entry, description)
     appliance = coordinator.appliance
     device_info = DeviceInfo(
         hw_version=appliance.info.get("hwVersion"),
@@ -195,22 +281,92 @@ async def async_setup_entry(
 
     available_entities = get_available_entities(appliance)
 
+    if hass.data[HC_KEY].compact_description and not config_entry.data.get(
+        CONF_DESCRIPTION_COMPACTED
+    ):
+        # Only keep the parts of the description used by this integration,
+        # re-uploading the profile file restores the full description
+        _LOGGER.debug("Compacting description of %s", appliance.info.get("vib"))
+        old_description_hash = config_entry.data[CONF_DESCRIPTION_HASH]
+        description_hash = await async_save_description(
+            hass,
+            compact_description(description, get_referenced_entities(available_entities)),
+        )
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={
+                **config_entry.data,
+                CONF_DESCRIPTION_HASH: description_hash,
+                CONF_DESCRIPTION_COMPACTED: True,
+            },
+        )
+        await async_remove_unused_description(hass, old_description_hash)
+    # Binary sensor platform is always needed for the connection sensor
+    used_platforms = {Platform.BINARY_SENSOR}
+    used_platforms.update(
+        DESCRIPTION_PLATFORMS[description_type]
+        for description_type, descriptions in available_entities.items()
+        if descriptions
+    )
+
+    scheduler = RequestScheduler(hass)
     config_entry.runtime_data = HCData(
         appliance=appliance,
         device_info=device_info,
         available_entity_descriptions=available_entities,
         coordinator=coordinator,
+        platforms=[platform for platform in PLATFORMS if platform in used_platforms],
+        reconciler=EntityReconciler(hass, config_entry),
+        batcher=WriteBatcher(hass, appliance, scheduler),
+        scheduler=scheduler,
+        snapshot=ValueSnapshot(appliance),
+        optimistic=OptimisticStats() if hass.data[HC_KEY].optimistic else None,
     )
 
+    config_entry.async_on_unload(config_entry.runtime_data.snapshot.async_stop)
     await coordinator.async_config_entry_first_refresh()
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        config_entry, config_entry.runtime_data.platforms
+    )
+    config_entry.runtime_data.reconciler.async_set_ready()
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: HCConfigEntry) -> bool:
+    """Migrate old config entries."""
+    _LOGGER.debug("Migrating from version %s.%s", config_entry.version, config_entry.minor_version)
+    if config_entry.version > 2:
+        # Downgrade from future version
+        return False
+
+    if config_entry.version == 1:
+        if config_entry.minor_version < 2:
+            hass.config_entries.async_update_entry(
+                config_entry,
+                data={**config_entry.data, CONF_DESCRIPTION_COMPACTED: False},
+                minor_version=2,
+            )
+
+        # Move description out of the config entry data, version 1 expects it there
+        data = {**config_entry.data}
+        data[CONF_DESCRIPTION_HASH] = await async_save_description(hass, data.pop(CONF_DESCRIPTION))
+        hass.config_entries.async_update_entry(config_entry, data=data, version=2, minor_version=1)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: HCConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug("Unloading %s", entry.data[CONF_DESCRIPTION]["info"].get("vib"))
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    _LOGGER.debug("Unloading %s", entry.title)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
     if unload_ok:
         await entry.runtime_data.coordinator.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: HCConfigEntry) -> None:
+    """Remove the stored description of a config entry."""
+    await async_remove_unused_description(
+        hass, entry.data.get(CONF_DESCRIPTION_HASH), entry.entry_id
+    )
@@ -0,0 +1,246 @@
+"""Batching of value writes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeconnect_websocket import CodeResponsError
+from homeconnect_websocket.entities import Command
+from homeconnect_websocket.message import Action, Message
+
+from .compat import convert_value_raw, set_value_shadow
+from .helpers import resolve_value, validate_value_raw
+from .scheduler import RequestScheduler, get_entity_priority
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingWrite:
+    """Queued value write of an Entity."""
+
+    entity: HcEntity
+    value: Any = None
+    futures: list[asyncio.Future[None]] = field(default_factory=list)
+
+    def set_result(self) -> None:
+        """Resolve all callers waiting for this write."""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(None)
+
+    def set_exception(self, exc: Exception) -> None:
+        """Fail all callers waiting for this write."""
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(exc)
+
+
+class WriteBatch:
+    """Writes queued inside a WriteBatcher.batch context."""
+
+    def __init__(self, batcher: WriteBatcher) -> None:
+        """Initialize the batch."""
+        self._batcher = batcher
+        self.futures: list[asyncio.Future[None]] = []
+
+    @callback
+    def set_value(
+        self, entity: HcEntity, value: Any, *, force: bool = False
+    ) -> asyncio.Future[None]:
+        """Queue a value write, resolved when the batch is sent."""
+        future = self._batcher.async_queue_value(entity, value, force=force)
+        self.futures.append(future)
+        return future
+
+    @callback
+    def set_value_raw(
+        self, entity: HcEntity, value_raw: Any, *, force: bool = False
+    ) -> asyncio.Future[None]:
+        """Queue a raw value write, resolved when the batch is sent."""
+        future = self._batcher.async_queue_value_raw(entity, value_raw, force=force)
+        self.futures.append(future)
+        return future
+
+
+class WriteBatcher:
+    """
+    Merge value writes of an Appliance into a single /ro/values POST.
+
+    Writes are validated before they are queued.
+    A write is sent on the next loop iteration, writes queued while a message is in flight
+    or inside a batch context are sent together.
+    If the Appliance rejects a merged message the writes are retried one by one,
+    so each caller gets its own result.
+    Writes of the value the Appliance already reported, or of the value in flight,
+    are not sent, unless forced.
+    Writes to Commands are always sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        appliance: HomeAppliance,
+        scheduler: RequestScheduler | None = None,
+    ) -> None:
+        """Initialize the batcher."""
+        self._hass = hass
+        self._appliance = appliance
+        self._scheduler = scheduler or RequestScheduler(hass)
+        self._pending: dict[int, PendingWrite] = {}
+        self._sending: dict[int, PendingWrite] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._batch_depth = 0
+        self._in_flight = 0
+        self.writes = 0
+        self.messages = 0
+        self.suppressed = 0
+
+    async def async_set_value(self, entity: HcEntity, value: Any, *, force: bool = False) -> None:
+        """Set the value of an Entity, enum values are resolved like Entity.set_value."""
+        await self.async_queue_value(entity, value, force=force)
+
+    async def async_set_value_raw(
+        self, entity: HcEntity, value_raw: Any, *, force: bool = False
+    ) -> None:
+        """Set the raw value of an Entity."""
+        await self.async_queue_value_raw(entity, value_raw, force=force)
+
+    @callback
+    def async_queue_value(
+        self, entity: HcEntity, value: Any, *, force: bool = False
+    ) -> asyncio.Future[None]:
+        """Queue a value write, enum values are resolved like Entity.set_value."""
+        return self.async_queue_value_raw(entity, resolve_value(entity, value), force=force)
+
+    @callback
+    def async_queue_value_raw(
+        self, entity: HcEntity, value_raw: Any, *, force: bool = False
+    ) -> asyncio.Future[None]:
+        """Queue a raw value write, the last queued value of an Entity wins."""
+        value_raw = convert_value_raw(entity, value_raw)
+        # Invalid writes fail here instead of being rejected by the Appliance
+        validate_value_raw(entity, value_raw)
+        write = self._pending.get(entity.uid)
+        future = self._hass.loop.create_future()
+        if write is None and not force and not isinstance(entity, Command):
+            # Compare against a write in flight, the Appliance hasn't confirmed it yet
+            if (sending := self._sending.get(entity.uid)) is not None:
+                if sending.value == value_raw:
+                    self.suppressed += 1
+                    sending.futures.append(future)
+                    return future
+            elif entity.value_raw == value_raw:
+                self.suppressed += 1
+                future.set_result(None)
+                return future
+        if write is None:
+            write = self._pending[entity.uid] = PendingWrite(entity)
+        write.value = value_raw
+        write.futures.append(future)
+        self.writes += 1
+        self._async_schedule_flush()
+        return future
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush on the next loop iteration, unless a message is in flight."""
+        if (
+            self._pending
+            and not self._batch_depth
+            and not self._in_flight
+            and self._flush_handle is None
+        ):
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush_later)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[WriteBatch]:
+        """Send all writes queued inside the context in one message, raise the first error."""
+        write_batch = WriteBatch(self)
+        self._batch_depth += 1
+        try:
+            yield write_batch
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                await self.async_flush()
+        await asyncio.gather(*write_batch.futures)
+
+    @callback
+    def _async_flush_later(self) -> None:
+        self._flush_handle = None
+        if not self._batch_depth:
+            self._hass.async_create_task(self.async_flush(), eager_start=True)
+
+    async def async_flush(self) -> None:
+        """Send all queued writes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        writes = list(self._pending.values())
+        self._pending = {}
+        if not writes:
+            return
+        self._in_flight += 1
+        for write in writes:
+            self._sending[write.entity.uid] = write
+        try:
+            await self._async_flush_writes(writes)
+        finally:
+            self._in_flight -= 1
+            for write in writes:
+                if self._sending.get(write.entity.uid) is write:
+                    del self._sending[write.entity.uid]
+            # Writes queued while the message was in flight
+            self._async_schedule_flush()
+
+    async def _async_flush_writes(self, writes: list[PendingWrite]) -> None:
+        try:
+            await self._async_send(writes)
+        except CodeResponsError as exc:
+            if len(writes) == 1:
+                writes[0].set_exception(exc)
+                return
+            _LOGGER.debug("Batched write rejected, retrying %s writes one by one", len(writes))
+            for write in writes:
+                try:
+                    await self._async_send([write])
+                except Exception as write_exc:  # noqa: BLE001
+                    write.set_exception(write_exc)
+                else:
+                    write.set_result()
+        except Exception as exc:  # noqa: BLE001
+            for write in writes:
+                write.set_exception(exc)
+        else:
+            for write in writes:
+                write.set_result()
+
+    async def _async_send(self, writes: list[PendingWrite]) -> None:
+        data = [{"uid": write.entity.uid, "value": write.value} for write in writes]
+        message = Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=data[0] if len(data) == 1 else data,
+        )
+        self.messages += 1
+        # A merged message is sent with the priority of its most urgent write
+        priority = min(get_entity_priority(write.entity) for write in writes)
+        response = await self._scheduler.async_send(
+            priority, self._appliance.session.send_sync, message
+        )
+        if response is not None and response.action == Action.RESPONSE and response.code is None:
+            for write in writes:
+                set_value_shadow(write.entity, write.value)
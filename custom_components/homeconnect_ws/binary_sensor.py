@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .entity import HCEntity
 from .entity_descriptions.descriptions_definitions import HCBinarySensorEntityDescription
-from .helpers import create_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -38,9 +37,12 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up binary_sensor platform."""
-    entities = create_entities({"binary_sensor": HCBinarySensor}, config_entry.runtime_data)
-    entities.add(HCConnectionSensor(CONNECTION_SENSOR_DESCRIPTIONS, config_entry.runtime_data))
-    async_add_entites(entities)
+    config_entry.runtime_data.reconciler.async_add_platform(
+        {"binary_sensor": HCBinarySensor}, async_add_entites
+    )
+    async_add_entites(
+        [HCConnectionSensor(CONNECTION_SENSOR_DESCRIPTIONS, config_entry.runtime_data)]
+    )
 
 
 class HCBinarySensor(HCEntity, BinarySensorEntity):
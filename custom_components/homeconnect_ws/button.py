@@ -8,7 +8,8 @@ from homeassistant.components.button import ButtonEntity
 from homeconnect_websocket.entities import Execution
 
 from .entity import HCEntity
-from .helpers import create_entities, error_decorator
+from .helpers import error_decorator
+from .scheduler import Priority
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -27,10 +28,9 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up button platform."""
-    entities = create_entities(
-        {"button": HCButton, "start_button": HCStartButton}, config_entry.runtime_data
+    config_entry.runtime_data.reconciler.async_add_platform(
+        {"button": HCButton, "start_button": HCStartButton}, async_add_entites
     )
-    async_add_entites(entities)
 
 
 class HCButton(HCEntity, ButtonEntity):
@@ -40,7 +40,11 @@ class HCButton(HCEntity, ButtonEntity):
     entity_description: HCButtonEntityDescription
 
     async def async_press(self) -> None:
-        await self._entity.set_value(True)
+        await self._runtime_data.scheduler.async_send(
+            Priority.COMMAND,
+            self._entity.set_value,
+            True,  # noqa: FBT003
+        )
 
 
 class HCStartButton(HCEntity, ButtonEntity):
@@ -62,4 +66,6 @@ class HCStartButton(HCEntity, ButtonEntity):
 
     @error_decorator
     async def async_press(self) -> None:
-        await self._runtime_data.appliance.selected_program.start()
+        await self._runtime_data.scheduler.async_send(
+            Priority.PROGRAM, self._runtime_data.appliance.selected_program.start
+        )
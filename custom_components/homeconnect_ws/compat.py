@@ -0,0 +1,29 @@
+"""
+Access to private parts of homeconnect_websocket.
+
+homeconnect_websocket has no public API to convert a value to the protocol type of an
+Entity or to update the shadow value after a write that was not sent by Entity.set_value.
+All access to private attributes is kept here, tests/test_compat.py pins the behavior
+of the required library version.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+
+def convert_value_raw(entity: HcEntity, value_raw: Any) -> Any:
+    """
+    Convert a raw value to the protocol type of an Entity, like Entity.set_value_raw.
+
+    Raises ValueError or TypeError if the value can't be converted.
+    """
+    return entity._type(value_raw)  # noqa: SLF001
+
+
+def set_value_shadow(entity: HcEntity, value_raw: Any) -> None:
+    """Set the shadow value of an Entity after a successful write, like Entity.set_value_raw."""
+    entity._value_shadow = value_raw  # noqa: SLF001
@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import random
 import re
-from asyncio import Event, wait_for
+from asyncio import Event, Semaphore, Task, gather, wait_for
 from binascii import Error as BinasciiError
-from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from homeassistant.components.file_upload import process_uploaded_file
-from homeassistant.config_entries import SOURCE_IGNORE, ConfigFlow
+from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_IMPORT, ConfigFlow
 from homeassistant.const import (
     CONF_DESCRIPTION,
     CONF_DEVICE,
@@ -25,6 +26,7 @@ from homeassistant.const import (
     CONF_MODE,
     CONF_NAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     FileSelector,
     FileSelectorConfig,
@@ -32,6 +34,7 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeconnect_websocket import (
     ConnectionState,
     DeviceDescription,
@@ -41,11 +44,27 @@ from homeconnect_websocket import (
 )
 
 from . import HC_KEY, HCConfig
-from .const import CONF_AES_IV, CONF_FILE, CONF_MANUAL_HOST, CONF_PSK, DOMAIN
+from .const import (
+    CONF_AES_IV,
+    CONF_DESCRIPTION_COMPACTED,
+    CONF_DESCRIPTION_HASH,
+    CONF_FILE,
+    CONF_MANUAL_HOST,
+    CONF_PSK,
+    DOMAIN,
+    MAX_PARALLEL_CONNECTION_TESTS,
+    MAX_PROFILE_MEMBER_SIZE,
+    MAX_PROFILE_SIZE,
+)
+from .helpers import copy_description
+from .storage import (
+    PROFILE_CACHE_DIR,
+    ProfileCache,
+    async_remove_unused_description,
+    async_save_description,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from homeassistant.config_entries import ConfigFlowResult
     from homeassistant.data_entry_flow import FlowResult
     from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
@@ -64,6 +83,9 @@ CONFIG_FILE_SCHEMA_JSON = vol.Schema(
         vol.Required(CONF_FILE): FileSelector(config=FileSelectorConfig(accept=".zip,.json")),
     }
 )
+ADD_ALL_APPLIANCES = "all"
+APPLIANCE_INFO_KEYS = {"haId", "deviceDescriptionFileName", "featureMappingFileName"}
+PROFILE_READ_CHUNK_SIZE = 64 * 1024
 CONFIG_HOST_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -71,29 +93,82 @@ CONFIG_HOST_SCHEMA = vol.Schema(
 )
 
 
-def process_zip_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
-    """Process uploaded zip file."""
-    profile_file = ZipFile(config_path)
+def _hash_member(profile_file: ZipFile, member: ZipInfo) -> bytes:
+    """Get the content hash of a profile file member without reading it into memory."""
+    member_hash = hashlib.sha256()
+    with profile_file.open(member) as file:
+        while chunk := file.read(PROFILE_READ_CHUNK_SIZE):
+            member_hash.update(chunk)
+    return member_hash.digest()
 
-    appliances = {}
-    re_info = re.compile(".*.json$")
-    infolist = profile_file.infolist()
-    for file in infolist:
-        if re_info.match(file.filename):
-            appliance_info = json.load(profile_file.open(file))
 
-            description_file_name = appliance_info["deviceDescriptionFileName"]
-            feature_file_name = appliance_info["featureMappingFileName"]
-            description_file = profile_file.open(description_file_name).read()
-            feature_file = profile_file.open(feature_file_name).read()
+def process_zip_file(
+    config_path: Path, profile_cache: ProfileCache | None = None
+) -> dict[str, dict[str, dict | DeviceDescription]]:
+    """Process uploaded zip file."""
+    with ZipFile(config_path) as profile_file:
+        members = {member.filename: member for member in profile_file.infolist()}
+        total_size = 0
+
+        def get_member(file_name: str) -> ZipInfo:
+            nonlocal total_size
+            member = members[file_name]
+            total_size += member.file_size
+            if member.file_size > MAX_PROFILE_MEMBER_SIZE or total_size > MAX_PROFILE_SIZE:
+                msg = f"Profile file exceeds size limit at {file_name}"
+                raise ValueError(msg)
+            return member
+
+        appliance_files: list[tuple[dict, ZipInfo, ZipInfo]] = []
+        re_info = re.compile(r".*\.json$")
+        for file_name in members:
+            if re_info.match(file_name):
+                with profile_file.open(get_member(file_name)) as file:
+                    appliance_info = json.load(file)
+                if not isinstance(appliance_info, dict) or not APPLIANCE_INFO_KEYS.issubset(
+                    appliance_info
+                ):
+                    _LOGGER.debug("Skipping %s, not an Appliance info file", file_name)
+                    continue
+
+                appliance_files.append(
+                    (
+                        appliance_info,
+                        get_member(appliance_info["deviceDescriptionFileName"]),
+                        get_member(appliance_info["featureMappingFileName"]),
+                    )
+                )
 
-            appliance_description = parse_device_description(description_file, feature_file)
+        def parse_description(
+            description_member: ZipInfo, feature_member: ZipInfo
+        ) -> DeviceDescription:
+            cache_key = None
+            if profile_cache is not None:
+                cache_key = profile_cache.get_key(
+                    _hash_member(profile_file, description_member),
+                    _hash_member(profile_file, feature_member),
+                )
+                if (description := profile_cache.get(cache_key)) is not None:
+                    _LOGGER.debug("Using cached description %s", cache_key)
+                    return description
+            # XML is parsed incrementally from the archive members
+            with (
+                profile_file.open(description_member) as description_file,
+                profile_file.open(feature_member) as feature_file,
+            ):
+                description = parse_device_description(description_file, feature_file)
+            if cache_key is not None:
+                profile_cache.set(cache_key, description)
+            return description
+
+        appliances = {}
+        for appliance_info, description_member, feature_member in appliance_files:
             appliances[appliance_info["haId"]] = {
                 "info": appliance_info,
-                "description": appliance_description,
+                "description": parse_description(description_member, feature_member),
             }
             _LOGGER.debug("Found Appliance %s", appliance_info["vib"])
-    return appliances
+        return appliances
 
 
 def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
@@ -106,6 +181,9 @@ def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDes
 class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     """HomeConnect Config flow."""
 
+    VERSION = 2
+    MINOR_VERSION = 1
+
     def __init__(self) -> None:
         super().__init__()
         self.errors = {}
@@ -113,48 +191,63 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         self.appliances: dict[str, dict[str, dict | DeviceDescription]] = {}
         self.reauth_entry: HCConfigEntry = None
         self.global_config: HCConfig | None = None
+        self.add_all_task: Task[tuple[list[str], list[str]]] | None = None
 
     def _process_profile_file(
         self, uploaded_file_id: str
     ) -> dict[str, dict[str, dict | DeviceDescription]]:
         with process_uploaded_file(self.hass, uploaded_file_id) as config_path:
             if config_path.suffix == ".zip":
-                return process_zip_file(config_path)
+                return process_zip_file(
+                    config_path,
+                    ProfileCache(Path(self.hass.config.path(STORAGE_DIR, PROFILE_CACHE_DIR))),
+                )
             if config_path.suffix == ".json":
                 return process_json_file(config_path)
             msg = "Unexpected profile file suffix: %s"
             raise ValueError(msg, config_path.name)
 
-    def _set_encryption_keys(self, appliance_info: dict) -> None:
-        self.data[CONF_MODE] = appliance_info["connectionType"]
-        if self.data[CONF_MODE] == "TLS":
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = (
+    def _set_encryption_keys(self, data: dict, appliance_info: dict) -> None:
+        data[CONF_MODE] = appliance_info["connectionType"]
+        if data[CONF_MODE] == "TLS":
+            if CONF_HOST not in data:
+                data[CONF_HOST] = (
                     f"{appliance_info['brand']}-{appliance_info['type']}-{appliance_info['haId']}"
                 )
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
+                _LOGGER.debug("Set Host to: %s", data[CONF_HOST])
+            data[CONF_PSK] = appliance_info["key"]
         else:
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = appliance_info["haId"]
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
-            self.data[CONF_AES_IV] = appliance_info["iv"]
-        _LOGGER.debug("Set Keys for %s Appliance", self.data[CONF_MODE])
+            if CONF_HOST not in data:
+                data[CONF_HOST] = appliance_info["haId"]
+                _LOGGER.debug("Set Host to: %s", data[CONF_HOST])
+            data[CONF_PSK] = appliance_info["key"]
+            data[CONF_AES_IV] = appliance_info["iv"]
+        _LOGGER.debug("Set Keys for %s Appliance", data[CONF_MODE])
 
         if self.global_config:
             if self.global_config.override_host is not None:
                 # Dev mode host override
-                self.data[CONF_HOST] = self.global_config.override_host
-                self.data[CONF_MANUAL_HOST] = True
-                _LOGGER.info("Host override: %s", self.data[CONF_HOST])
+                data[CONF_HOST] = self.global_config.override_host
+                data[CONF_MANUAL_HOST] = True
+                _LOGGER.info("Host override: %s", data[CONF_HOST])
             if self.global_config.override_psk is not None:
                 # Dev mode psk override
-                self.data[CONF_PSK] = self.global_config.override_psk
-                self.data[CONF_MODE] = "TLS"
-                self.data[CONF_AES_IV] = None
+                data[CONF_PSK] = self.global_config.override_psk
+                data[CONF_MODE] = "TLS"
+                data[CONF_AES_IV] = None
                 _LOGGER.info("PSK override")
 
+    def _set_appliance_data(self, data: dict, appliance: dict) -> None:
+        appliance_info = appliance["info"]
+
+        data[CONF_DESCRIPTION] = appliance["description"]
+        data[CONF_DESCRIPTION_COMPACTED] = False
+
+        data[CONF_DEVICE_ID] = random.randbytes(4).hex()  # noqa: S311
+        data[CONF_NAME] = f"{appliance_info['brand']} {appliance_info['type']}"
+
+        self._set_encryption_keys(data, appliance_info)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle a flow initialized by the user."""
         _LOGGER.debug("Config flow initialized by user")
@@ -213,6 +306,8 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle device selection."""
         if user_input is not None:
+            if user_input[CONF_DEVICE] == ADD_ALL_APPLIANCES:
+                return await self.async_step_add_all()
             await self.async_set_unique_id(user_input[CONF_DEVICE])
             return await self.async_step_set_data()
 
@@ -246,10 +341,15 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(appliance_options[0]["value"])
             return await self.async_step_set_data()
         _LOGGER.debug("Found %s Appliances not setup", len(appliance_options))
+        appliance_options.append(
+            SelectOptionDict(value=ADD_ALL_APPLIANCES, label="All Appliances"),
+        )
         schema = vol.Schema(
             {
                 vol.Required(CONF_DEVICE): SelectSelector(
-                    SelectSelectorConfig(options=appliance_options, sort=True)
+                    SelectSelectorConfig(
+                        options=appliance_options, sort=True, translation_key="device_select"
+                    )
                 )
             }
         )
@@ -259,8 +359,20 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Test connection with Appliance."""
-        _LOGGER.debug("Testing connection to %s Appliance", self.data[CONF_MODE])
         self.errors = {}
+        if error := await self._test_connection(self.data):
+            if error == "auth_failed":
+                return self.async_abort(reason="auth_failed")
+            self.errors["base"] = error
+            _LOGGER.debug("Connection error, showing host step")
+            return await self.async_step_host()
+        _LOGGER.debug("config vaild, adding config entry")
+        return await self.async_step_create_entry(self.data)
+
+    async def _test_connection(self, data: dict) -> str | None:
+        """Test connection with Appliance, return error key if failed."""
+        _LOGGER.debug("Testing connection to %s Appliance", data[CONF_MODE])
+        error = None
         event = Event()
 
         async def connection_callback(state: ConnectionState) -> None:
@@ -268,38 +380,118 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 event.set()
 
         appliance = HomeAppliance(
-            description=deepcopy(self.data[CONF_DESCRIPTION]),
-            host=self.data[CONF_HOST],
+            description=copy_description(data[CONF_DESCRIPTION]),
+            host=data[CONF_HOST],
             app_name="Homeassistant",
-            app_id=self.data[CONF_DEVICE_ID],
-            psk64=self.data[CONF_PSK],
-            iv64=self.data.get(CONF_AES_IV, None),
+            app_id=data[CONF_DEVICE_ID],
+            psk64=data[CONF_PSK],
+            iv64=data.get(CONF_AES_IV),
             connection_callback=connection_callback,
         )
         try:
             await appliance.connect()
             await wait_for(event.wait(), timeout=20)
-            self.data[CONF_DESCRIPTION]["info"].update(appliance.info)
+            data[CONF_DESCRIPTION]["info"].update(appliance.info)
 
         except ClientConnectorSSLError as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
-            if self.data[CONF_MODE] == "TLS":
-                self.errors["base"] = "cannot_connect"
-            else:
-                return self.async_abort(reason="auth_failed")
+            error = "cannot_connect" if data[CONF_MODE] == "TLS" else "auth_failed"
         except BinasciiError as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
-            return self.async_abort(reason="auth_failed")
+            error = "auth_failed"
         except (TimeoutError, ClientConnectionError) as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
-            self.errors["base"] = "cannot_connect"
+            error = "cannot_connect"
         finally:
             await appliance.close()
-        if self.errors:
-            _LOGGER.debug("Connection error, showing host step")
-            return await self.async_step_host()
-        _LOGGER.debug("config vaild, adding config entry")
-        return await self.async_step_create_entry(self.data)
+        return error
+
+    async def async_step_add_all(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add all Appliances not setup yet."""
+        if self.add_all_task is None:
+            appliances: dict[str, dict] = {}
+            for appliance_id, appliance in self.appliances.items():
+                existing_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+                    self.handler, appliance_id
+                )
+                if existing_entry and existing_entry.source != SOURCE_IGNORE:
+                    continue
+                data = {}
+                try:
+                    self._set_appliance_data(data, appliance)
+                except (KeyError, ValueError):
+                    return self.async_abort(reason="invalid_profile_file")
+                appliances[appliance_id] = data
+            _LOGGER.debug("Adding %s Appliances", len(appliances))
+            self.add_all_task = self.hass.async_create_task(self._async_add_all(appliances))
+
+        if not self.add_all_task.done():
+            return self.async_show_progress(
+                step_id="add_all",
+                progress_action="add_all",
+                progress_task=self.add_all_task,
+            )
+        return self.async_show_progress_done(next_step_id="add_all_finished")
+
+    @callback
+    def async_remove(self) -> None:
+        """Cancel adding all Appliances when the flow is closed."""
+        if self.add_all_task is not None and not self.add_all_task.done():
+            self.add_all_task.cancel()
+
+    async def _async_add_all(self, appliances: dict[str, dict]) -> tuple[list[str], list[str]]:
+        """Test the connection to all Appliances and add the reachable ones."""
+        semaphore = Semaphore(MAX_PARALLEL_CONNECTION_TESTS)
+
+        async def test_connection(data: dict) -> str | None:
+            async with semaphore:
+                return await self._test_connection(data)
+
+        errors = await gather(*(test_connection(data) for data in appliances.values()))
+
+        added = []
+        failed = []
+        for (appliance_id, data), error in zip(appliances.items(), errors, strict=True):
+            appliance_info = self.appliances[appliance_id]["info"]
+            appliance_name = f"{data[CONF_NAME]} ({appliance_info['vib']})"
+            if error:
+                _LOGGER.debug("Failed to add %s: %s", appliance_info["vib"], error)
+                failed.append(appliance_name)
+                continue
+            await self.hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data={CONF_DEVICE: appliance_id, **data},
+            )
+            added.append(appliance_name)
+        return added, failed
+
+    async def async_step_add_all_finished(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Show the Appliances added with the add all step."""
+        added, failed = self.add_all_task.result()
+        return self.async_abort(
+            reason="add_all_finished",
+            description_placeholders={
+                "added": ", ".join(added) or "-",
+                "failed": ", ".join(failed) or "-",
+            },
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an config entry for an Appliance added with the add all step."""
+        data = {**import_data}
+        await self.async_set_unique_id(data.pop(CONF_DEVICE))
+        existing_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+            self.handler, self.unique_id
+        )
+        # Ignored entries are replaced, like in the user step
+        if existing_entry and existing_entry.source != SOURCE_IGNORE:
+            return self.async_abort(reason="already_configured")
+        return await self.async_step_create_entry(data)
 
     async def async_step_host(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle Host setting."""
@@ -321,11 +513,18 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def async_step_create_entry(self, data: dict) -> ConfigFlowResult:
         """Create an config entry or update existing entry for reauth."""
+        data = {**data}
+        data[CONF_DESCRIPTION_HASH] = await async_save_description(
+            self.hass, data.pop(CONF_DESCRIPTION)
+        )
         if self.reauth_entry:
-            return self.async_update_reload_and_abort(
+            old_description_hash = self.reauth_entry.data.get(CONF_DESCRIPTION_HASH)
+            result = self.async_update_reload_and_abort(
                 self.reauth_entry,
                 data_updates=data,
             )
+            await async_remove_unused_description(self.hass, old_description_hash)
+            return result
         return self.async_create_entry(title=data[CONF_NAME], data=data)
 
     async def async_step_reauth(self, user_input: dict[str, Any]) -> ConfigFlowResult:
@@ -335,6 +534,16 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         self.data[CONF_HOST] = self.reauth_entry.data[CONF_HOST]
         return await self.async_step_upload()
 
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Reconfigure flow initialized."""
+        _LOGGER.debug("Reconfigure flow initialized")
+        self.reauth_entry = self._get_reconfigure_entry()
+        await self.async_set_unique_id(self.reauth_entry.unique_id)
+        self.data[CONF_HOST] = self.reauth_entry.data[CONF_HOST]
+        return await self.async_step_upload()
+
     async def async_step_set_data(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -342,16 +551,8 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         if self.unique_id not in self.appliances:
             return self.async_abort(reason="appliance_not_in_profile_file")
 
-        appliance = self.appliances[self.unique_id]
         try:
-            appliance_info = appliance["info"]
-
-            self.data[CONF_DESCRIPTION] = appliance["description"]
-
-            self.data[CONF_DEVICE_ID] = random.randbytes(4).hex()  # noqa: S311
-            self.data[CONF_NAME] = f"{appliance_info['brand']} {appliance_info['type']}"
-
-            self._set_encryption_keys(appliance_info)
+            self._set_appliance_data(self.data, self.appliances[self.unique_id])
         except (KeyError, ValueError):
             return self.async_abort(reason="invalid_profile_file")
 
@@ -364,15 +565,25 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 discovery_info.properties["vib"],
                 discovery_info.host,
             )
+            host = str(discovery_info.ip_address)
+            discovery = self.hass.data.setdefault(HC_KEY, HCConfig()).discovery
+            if not discovery.async_process(discovery_info.properties["id"], host):
+                # Same announcement was handled recently
+                return self.async_abort(reason="discovery_throttled")
+
             await self.async_set_unique_id(discovery_info.properties["id"])
             updates = None
             config_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
                 self.handler, self.unique_id
             )
-            if config_entry and not config_entry.data.get(CONF_MANUAL_HOST, False):
-                updates = {CONF_HOST: str(discovery_info.ip_address)}
+            if (
+                config_entry
+                and not config_entry.data.get(CONF_MANUAL_HOST, False)
+                and config_entry.data.get(CONF_HOST) != host
+            ):
+                updates = {CONF_HOST: host}
             self._abort_if_unique_id_configured(updates=updates)
-            self.data[CONF_HOST] = str(discovery_info.ip_address)
+            self.data[CONF_HOST] = host
             self.data[CONF_NAME] = (
                 f"{discovery_info.properties['brand']} {discovery_info.properties['type']}"
             )
@@ -17,6 +17,21 @@ PLATFORMS: Final = [
     Platform.LIGHT,
     Platform.FAN,
 ]
+DESCRIPTION_PLATFORMS: Final = {
+    "button": Platform.BUTTON,
+    "start_button": Platform.BUTTON,
+    "active_program": Platform.SENSOR,
+    "event_sensor": Platform.SENSOR,
+    "sensor": Platform.SENSOR,
+    "wifi": Platform.SENSOR,
+    "binary_sensor": Platform.BINARY_SENSOR,
+    "number": Platform.NUMBER,
+    "program": Platform.SELECT,
+    "select": Platform.SELECT,
+    "switch": Platform.SWITCH,
+    "light": Platform.LIGHT,
+    "fan": Platform.FAN,
+}
 
 CONF_PSK: Final = "psk"
 CONF_AES_IV: Final = "aes_iv"
@@ -25,5 +40,17 @@ CONF_MANUAL_HOST: Final = "manual_host"
 CONF_DEV_SETUP_FROM_DUMP: Final = "setup_from_dump_enabled"
 CONF_DEV_OVERRIDE_HOST: Final = "override_host"
 CONF_DEV_OVERRIDE_PSK: Final = "override_psk"
+CONF_COMPACT_DESCRIPTION: Final = "compact_description"
+CONF_DESCRIPTION_COMPACTED: Final = "description_compacted"
+CONF_DESCRIPTION_HASH: Final = "description_hash"
+CONF_OPTIMISTIC: Final = "optimistic"
 
 MAX_RECONECT_TIME: Final = 300
+DISCOVERY_WINDOW: Final = 300
+MAX_PROFILE_MEMBER_SIZE: Final = 32 * 1024 * 1024
+MAX_PROFILE_SIZE: Final = 256 * 1024 * 1024
+MAX_PARALLEL_CONNECTION_TESTS: Final = 4
+MAX_PARALLEL_REQUESTS: Final = 2
+MAX_PARALLEL_SERVICE_CALLS: Final = 8
+PROFILE_CACHE_MAX_SIZE: Final = 16 * 1024 * 1024
+OPTIMISTIC_CONFIRM_TIMEOUT: Final = 10
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import logging
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST
+from homeassistant.const import CONF_DEVICE_ID, CONF_HOST
 from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeconnect_websocket import (
@@ -23,9 +22,11 @@ from .const import (
     CONF_PSK,
     MAX_RECONECT_TIME,
 )
+from .helpers import copy_description
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription
 
     from . import HCConfigEntry
 
@@ -45,18 +46,19 @@ class HomeConnectCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         config_entry: HCConfigEntry,
+        description: DeviceDescription,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             # Name of the data. For logging purposes.
-            name=config_entry.data["description"]["info"]["vib"],
+            name=description["info"]["vib"],
             config_entry=config_entry,
             always_update=True,
         )
         self.appliance = HomeAppliance(
-            description=deepcopy(config_entry.data[CONF_DESCRIPTION]),
+            description=copy_description(description),
             host=config_entry.data[CONF_HOST],
             app_name="Homeassistant",
             app_id=config_entry.data[CONF_DEVICE_ID],
@@ -77,9 +79,7 @@ class HomeConnectCoordinator(DataUpdateCoordinator):
         self.config_entry.async_create_task(self.hass, self._connect())
 
     async def _connect(self) -> None:
-        self.logger.debug(
-            "Connecting to %s", self.config_entry.data[CONF_DESCRIPTION]["info"].get("vib")
-        )
+        self.logger.debug("Connecting to %s", self.appliance.info.get("vib"))
         first_failure = True
         while self._connecting:
             try:
@@ -118,10 +118,14 @@ class HomeConnectCoordinator(DataUpdateCoordinator):
 
         elif event == ConnectionState.CONNECTED:
             self.connected = True
+            # Entities can depend on values and description changes received on connect
+            self.config_entry.async_create_task(
+                self.hass, self.config_entry.runtime_data.reconciler.async_reconcile()
+            )
             if self._reconnecting:
                 self.logger.debug(
                     "Reconnected to %s",
-                    self.config_entry.data[CONF_DESCRIPTION]["info"].get("vib"),
+                    self.appliance.info.get("vib"),
                 )
                 self._reconnecting = False
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID
 
-from .const import CONF_AES_IV, CONF_PSK
+from . import HC_KEY, HCConfig
+from .const import CONF_AES_IV, CONF_DESCRIPTION_HASH, CONF_PSK
+from .storage import async_load_description
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,11 +21,36 @@ TO_REDACT = [CONF_PSK, CONF_AES_IV, CONF_DEVICE_ID, "serialNumber", "deviceID",
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant,  # noqa: ARG001
+    hass: HomeAssistant,
     entry: HCConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    entry_data = {
+        **entry.data,
+        CONF_DESCRIPTION: await async_load_description(hass, entry.data[CONF_DESCRIPTION_HASH]),
+    }
+    discovery = hass.data.get(HC_KEY, HCConfig()).discovery
+    discovery_stats = discovery.get_stats(entry.unique_id)
     return {
-        "entry_data": async_redact_data(entry.data, TO_REDACT),
+        "entry_data": async_redact_data(entry_data, TO_REDACT),
         "appliance_state": entry.runtime_data.appliance.dump(),
+        "discovery": {
+            "received": discovery.received,
+            "acted_on": discovery.acted_on,
+            "appliance": asdict(discovery_stats) if discovery_stats else None,
+        },
+        "writes": {
+            "writes": entry.runtime_data.batcher.writes,
+            "messages": entry.runtime_data.batcher.messages,
+            "suppressed": entry.runtime_data.batcher.suppressed,
+        },
+        "requests": {
+            "in_flight": entry.runtime_data.scheduler.in_flight,
+            "queue_depth": entry.runtime_data.scheduler.queue_depth,
+            **{
+                priority.name.lower(): asdict(stats)
+                for priority, stats in entry.runtime_data.scheduler.stats.items()
+            },
+        },
+        "optimistic": asdict(optimistic) if (optimistic := entry.runtime_data.optimistic) else None,
     }
@@ -0,0 +1,57 @@
+"""Zeroconf discovery aggregation."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from .const import DISCOVERY_WINDOW
+
+
+@dataclass
+class DiscoveryStats:
+    """Discovery counters of an Appliance."""
+
+    received: int = 0
+    acted_on: int = 0
+    host: str | None = None
+    last_acted_on: float | None = None
+
+
+class DiscoveryAggregator:
+    """Collapse repeated zeroconf announcements of an Appliance."""
+
+    def __init__(self, window: float = DISCOVERY_WINDOW) -> None:
+        """Initialize the aggregator."""
+        self._window = window
+        self._appliances: dict[str, DiscoveryStats] = {}
+
+    def async_process(self, appliance_id: str, host: str) -> bool:
+        """Register an announcement, return True if it should be acted on."""
+        now = time.monotonic()
+        stats = self._appliances.setdefault(appliance_id, DiscoveryStats())
+        stats.received += 1
+        if (
+            stats.host == host
+            and stats.last_acted_on is not None
+            and now - stats.last_acted_on < self._window
+        ):
+            return False
+        stats.host = host
+        stats.last_acted_on = now
+        stats.acted_on += 1
+        return True
+
+    def get_stats(self, appliance_id: str) -> DiscoveryStats | None:
+        """Get discovery counters of an Appliance."""
+        return self._appliances.get(appliance_id)
+
+    @property
+    def received(self) -> int:
+        """Total number of received announcements."""
+        return sum(stats.received for stats in self._appliances.values())
+
+    @property
+    def acted_on(self) -> int:
+        """Total number of announcements acted on."""
+        return sum(stats.acted_on for stats in self._appliances.values())
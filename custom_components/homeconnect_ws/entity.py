@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .helpers import entity_is_available
+from .const import OPTIMISTIC_CONFIRM_TIMEOUT
+from .helpers import entity_is_available, get_favorite_name_entity, get_program_name
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE
     from homeassistant.helpers.device_registry import DeviceInfo
     from homeconnect_websocket.entities import Entity as HcEntity
 
@@ -18,11 +27,22 @@ if TYPE_CHECKING:
     from .entity_descriptions.descriptions_definitions import (
         ExtraAttributeDict,
         HCEntityDescription,
+        HCSelectEntityDescription,
+        HCSensorEntityDescription,
     )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class OptimisticStats:
+    """Counters of optimistic writes."""
+
+    pending: int = 0
+    confirmed: int = 0
+    rolled_back: int = 0
+
+
 class HCEntity(CoordinatorEntity, Entity):
     """Base Entity."""
 
@@ -32,6 +52,11 @@ class HCEntity(CoordinatorEntity, Entity):
     _entities: list[HcEntity]
     _extra_attributes: list[ExtraAttributeDict]
     _has_callback: bool = False
+    # Requested state shown until the Appliance confirms the write
+    _optimistic_value: Any = UNDEFINED
+    # Value of the main Entity when the write was requested
+    _optimistic_base: Any = UNDEFINED
+    _optimistic_timeout: CALLBACK_TYPE | None = None
 
     def __init__(
         self,
@@ -67,6 +92,7 @@ class HCEntity(CoordinatorEntity, Entity):
     async def async_will_remove_from_hass(self) -> None:
         for entity in self._entities:
             entity.unregister_callback(self.callback)
+        self._async_clear_optimistic()
 
     @property
     def available(self) -> bool:
@@ -99,8 +125,131 @@ class HCEntity(CoordinatorEntity, Entity):
                 extra_state_attributes[description["name"]] = entity.value
         return extra_state_attributes
 
-    async def callback(self, _: HcEntity) -> None:
+    @callback
+    def async_update_entity_description(self, entity_description: HCEntityDescription) -> bool:
+        """Apply a changed entity description in place, return False if not possible."""
+        return False
+
+    async def async_write_optimistic(self, value: Any, write: Awaitable[None]) -> None:
+        """
+        Show value while write is pending, if optimistic mode is enabled.
+
+        The value is kept until the Appliance notifies the requested value,
+        it's rolled back when the write fails, the Appliance notifies another value
+        or the write isn't confirmed in time.
+        """
+        stats = self._runtime_data.optimistic
+        if stats is None:
+            await write
+            return
+        self._async_clear_optimistic()
+        self._optimistic_value = value
+        self._optimistic_base = self._entity.value if self._entity is not None else UNDEFINED
+        stats.pending += 1
+        self.async_write_ha_state()
+        try:
+            await write
+        except BaseException:
+            # Also roll back cancelled writes
+            self._async_rollback_optimistic()
+            raise
+        finally:
+            stats.pending -= 1
+        if self._entity is None or self._optimistic_value == self._entity.value:
+            # No main Entity to confirm the write, or Appliance already is in the requested state
+            self._async_clear_optimistic()
+        elif self._optimistic_value is not UNDEFINED:
+            self._optimistic_timeout = async_call_later(
+                self.hass, OPTIMISTIC_CONFIRM_TIMEOUT, self._async_optimistic_timeout
+            )
+
+    @callback
+    def _async_clear_optimistic(self) -> None:
+        self._optimistic_value = UNDEFINED
+        self._optimistic_base = UNDEFINED
+        if self._optimistic_timeout is not None:
+            self._optimistic_timeout()
+            self._optimistic_timeout = None
+
+    @callback
+    def _async_rollback_optimistic(self) -> None:
+        if self._optimistic_value is UNDEFINED:
+            return
+        _LOGGER.debug("Rolling back optimistic state of %s", self.entity_id)
+        self._runtime_data.optimistic.rolled_back += 1
+        self._async_clear_optimistic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_optimistic_timeout(self, _: datetime) -> None:
+        self._optimistic_timeout = None
+        self._async_rollback_optimistic()
+
+    @property
+    def _value(self) -> Any:
+        """Value of the main Entity, or the optimistic value of a pending write."""
+        if self._optimistic_value is not UNDEFINED:
+            return self._optimistic_value
+        return self._entity.value
+
+    async def callback(self, entity: HcEntity) -> None:
+        if self._optimistic_value is not UNDEFINED and entity is self._entity:
+            if entity.value == self._optimistic_value:
+                self._runtime_data.optimistic.confirmed += 1
+                self._async_clear_optimistic()
+            elif entity.value != self._optimistic_base:
+                # Appliance changed to another value than requested,
+                # notifies without a value change (e.g. access) keep the optimistic value
+                self._async_rollback_optimistic()
         if not self._has_callback:
             self._has_callback = True
             self.async_write_ha_state()
             self._has_callback = False
+
+
+class HCProgramEntity(HCEntity):
+    """Base for Entities mapping programs to names, follows renamed favorites."""
+
+    entity_description: HCSelectEntityDescription | HCSensorEntityDescription
+    _programs: dict[str, str]
+    _rev_programs: dict[str, str]
+    _favorite_programs: dict[str, str]
+
+    def __init__(
+        self,
+        entity_description: HCSelectEntityDescription | HCSensorEntityDescription,
+        runtime_data: HCData,
+    ) -> None:
+        super().__init__(entity_description, runtime_data)
+        self._programs = dict(entity_description.mapping)
+        self._rev_programs = {value: key for key, value in self._programs.items()}
+        # favorite name setting -> program
+        self._favorite_programs = {}
+        for program in self._programs:
+            if favorite_name_entity := get_favorite_name_entity(runtime_data.appliance, program):
+                self._favorite_programs[favorite_name_entity.name] = program
+                self._entities.append(favorite_name_entity)
+
+    @callback
+    def async_update_entity_description(
+        self, entity_description: HCSelectEntityDescription | HCSensorEntityDescription
+    ) -> bool:
+        if (
+            entity_description.mapping.keys() != self._programs.keys()
+            or replace(entity_description, mapping=self.entity_description.mapping)
+            != self.entity_description
+        ):
+            return False
+        self.entity_description = entity_description
+        self._programs = dict(entity_description.mapping)
+        self._rev_programs = {value: key for key, value in self._programs.items()}
+        return True
+
+    async def callback(self, entity: HcEntity) -> None:
+        if program := self._favorite_programs.get(entity.name):
+            program_name = get_program_name(program, entity)
+            if self._programs[program] != program_name:
+                self._rev_programs.pop(self._programs[program], None)
+                self._programs[program] = program_name
+                self._rev_programs[program_name] = program
+        await super().callback(entity)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
-from custom_components.homeconnect_ws.helpers import merge_dicts
+from custom_components.homeconnect_ws.helpers import intern_description, merge_dicts
 
 from .common import COMMON_ENTITY_DESCRIPTIONS
 from .consumer_products import CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS
@@ -48,6 +49,18 @@ def get_all_entity_description() -> _EntityDescriptionsDefinitionsType:
     return ALL_ENTITY_DESCRIPTIONS
 
 
+def _resolve_entity_aliases[T: HCEntityDescription](
+    description: T, appliance_entities: set[str]
+) -> T | None:
+    """Resolve the Entity key of a description against the Appliance's Entities."""
+    if not description.entity_aliases or description.entity in appliance_entities:
+        return description
+    for alias in description.entity_aliases:
+        if alias in appliance_entities:
+            return intern_description(replace(description, entity=alias))
+    return None
+
+
 def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
     """Get all available Entity descriptions."""
     available_entities: _EntityDescriptionsType = {
@@ -72,13 +85,20 @@ def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
             for descriptions_fn in descriptions:
                 dynamic_descriptions: _EntityDescriptionsType = descriptions_fn(appliance)
                 for key, value in dynamic_descriptions.items():
-                    available_entities[key].extend(value)
+                    available_entities[key].extend(
+                        intern_description(description) for description in value
+                    )
             continue
         for description in descriptions:
             if callable(description):
                 if dynamic_description := description(appliance):
-                    available_entities[description_type].append(dynamic_description)
+                    available_entities[description_type].append(
+                        intern_description(dynamic_description)
+                    )
             else:
+                description = _resolve_entity_aliases(description, appliance_entities)  # noqa: PLW2901
+                if description is None:
+                    continue
                 all_subscribed_entities = set()
                 if description.entity:
                     all_subscribed_entities.add(description.entity)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 import sys
 from typing import TYPE_CHECKING
 
@@ -23,6 +22,8 @@ from homeassistant.const import (
 )
 from homeconnect_websocket.entities import Execution
 
+from custom_components.homeconnect_ws.helpers import get_favorite_name_entity, get_program_name
+
 from .descriptions_definitions import (
     EntityDescriptions,
     HCBinarySensorEntityDescription,
@@ -117,23 +118,10 @@ def generate_door_state(appliance: HomeAppliance) -> HCSensorEntityDescription |
 
 def generate_program(appliance: HomeAppliance) -> EntityDescriptions:
     """Get Door program select and sensor description."""
-    pattern = re.compile(r"^BSH\.Common\.Program\.Favorite\.(.*)$")
-
-    programs = {}
-
-    for program in appliance.programs:
-        if match := pattern.match(program):
-            favorite_name_entity = appliance.settings.get(
-                f"BSH.Common.Setting.Favorite.{match.groups()[0]}.Name"
-            )
-            if favorite_name_entity and favorite_name_entity.value:
-                program_name = favorite_name_entity.value
-            else:
-                program_name = f"favorite_{match.groups()[0]}"
-        else:
-            program_name = program.lower().replace(".", "_")
-
-        programs[program] = program_name
+    programs = {
+        program: get_program_name(program, get_favorite_name_entity(appliance, program))
+        for program in appliance.programs
+    }
 
     # sort programs
     programs_keys = list(programs.keys())
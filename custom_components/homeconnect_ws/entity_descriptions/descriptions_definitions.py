@@ -34,6 +34,7 @@ class HCEntityDescription(EntityDescription, frozen_or_thawed=True):
     """Description for Base Entity."""
 
     entity: str | None = None
+    entity_aliases: tuple[str, ...] | None = None
     entities: list[str] | None = None
     available_access: tuple[Access] | None = None
     extra_attributes: list[ExtraAttributeDict] = None
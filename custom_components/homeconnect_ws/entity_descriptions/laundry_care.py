@@ -453,6 +453,7 @@ LAUNDRY_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCSwitchEntityDescription(
             key="switch_laundry_speed_perfect",
             entity="LaundryCare.Common.Option.SpeedPerfect",
+            entity_aliases=("LaundryCare.Washer.Option.SpeedPerfect",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
@@ -478,21 +479,13 @@ LAUNDRY_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCSwitchEntityDescription(
             key="switch_laundry_idos1_active",
             entity="LaundryCare.Washer.Option.IDos1Active",
+            entity_aliases=("LaundryCare.Washer.Option.IDos1.Active",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
             key="switch_laundry_idos2_active",
             entity="LaundryCare.Washer.Option.IDos2Active",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_laundry_idos1_active",
-            entity="LaundryCare.Washer.Option.IDos1.Active",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_laundry_idos2_active",
-            entity="LaundryCare.Washer.Option.IDos2.Active",
+            entity_aliases=("LaundryCare.Washer.Option.IDos2.Active",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
@@ -510,11 +503,6 @@ LAUNDRY_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             entity="LaundryCare.Washer.Option.SilentWash",
             device_class=SwitchDeviceClass.SWITCH,
         ),
-        HCSwitchEntityDescription(
-            key="switch_laundry_speed_perfect",
-            entity="LaundryCare.Washer.Option.SpeedPerfect",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
         HCSwitchEntityDescription(
             key="switch_laundry_soak",
             entity="LaundryCare.Washer.Option.Soak",
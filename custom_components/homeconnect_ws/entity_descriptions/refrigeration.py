@@ -23,6 +23,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_chiller_common_door_state",
             entity="Refrigeration.Common.Status.Door.ChillerCommon",
+            entity_aliases=("Refrigeration.FridgeFreezer.Status.ChillerCommon",),
             device_class=BinarySensorDeviceClass.DOOR,
             entity_registry_enabled_default=False,
             value_on={"Open"},
@@ -31,6 +32,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_freezer_door_state",
             entity="Refrigeration.Common.Status.Door.Freezer",
+            entity_aliases=("Refrigeration.FridgeFreezer.Status.DoorFreezer",),
             device_class=BinarySensorDeviceClass.DOOR,
             value_on={"Open"},
             value_off={"Closed"},
@@ -38,28 +40,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_fridge_door_state",
             entity="Refrigeration.Common.Status.Door.Refrigerator",
-            device_class=BinarySensorDeviceClass.DOOR,
-            value_on={"Open"},
-            value_off={"Closed"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_chiller_common_door_state",
-            entity="Refrigeration.FridgeFreezer.Status.ChillerCommon",
-            device_class=BinarySensorDeviceClass.DOOR,
-            entity_registry_enabled_default=False,
-            value_on={"Open"},
-            value_off={"Closed"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_freezer_door_state",
-            entity="Refrigeration.FridgeFreezer.Status.DoorFreezer",
-            device_class=BinarySensorDeviceClass.DOOR,
-            value_on={"Open"},
-            value_off={"Closed"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_fridge_door_state",
-            entity="Refrigeration.FridgeFreezer.Status.DoorRefrigerator",
+            entity_aliases=("Refrigeration.FridgeFreezer.Status.DoorRefrigerator",),
             device_class=BinarySensorDeviceClass.DOOR,
             value_on={"Open"},
             value_off={"Closed"},
@@ -67,6 +48,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_door_alarm_chiller_common",
             entity="Refrigeration.FridgeFreezer.Event.DoorAlarmChillerCommon",
+            entity_aliases=("Refrigeration.Common.Event.Door.AlarmChillerCommon",),
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=BinarySensorDeviceClass.PROBLEM,
             entity_registry_enabled_default=False,
@@ -76,6 +58,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_door_alarm_freezer",
             entity="Refrigeration.FridgeFreezer.Event.DoorAlarmFreezer",
+            entity_aliases=("Refrigeration.Common.Event.Door.AlarmFreezer",),
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=BinarySensorDeviceClass.PROBLEM,
             value_on={"Present", "Confirmed"},
@@ -84,31 +67,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_door_alarm_fridge",
             entity="Refrigeration.FridgeFreezer.Event.DoorAlarmRefrigerator",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_class=BinarySensorDeviceClass.PROBLEM,
-            value_on={"Present", "Confirmed"},
-            value_off={"Off"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_door_alarm_chiller_common",
-            entity="Refrigeration.Common.Event.Door.AlarmChillerCommon",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_class=BinarySensorDeviceClass.PROBLEM,
-            entity_registry_enabled_default=False,
-            value_on={"Present", "Confirmed"},
-            value_off={"Off"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_door_alarm_freezer",
-            entity="Refrigeration.Common.Event.Door.AlarmFreezer",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_class=BinarySensorDeviceClass.PROBLEM,
-            value_on={"Present", "Confirmed"},
-            value_off={"Off"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_door_alarm_fridge",
-            entity="Refrigeration.Common.Event.Door.AlarmRefrigerator",
+            entity_aliases=("Refrigeration.Common.Event.Door.AlarmRefrigerator",),
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=BinarySensorDeviceClass.PROBLEM,
             value_on={"Present", "Confirmed"},
@@ -117,14 +76,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_temperature_alarm_freezer",
             entity="Refrigeration.FridgeFreezer.Event.TemperatureAlarmFreezer",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            device_class=BinarySensorDeviceClass.PROBLEM,
-            value_on={"Present", "Confirmed"},
-            value_off={"Off"},
-        ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_temperature_alarm_freezer",
-            entity="Refrigeration.Common.Event.Freezer.TemperatureAlarm",
+            entity_aliases=("Refrigeration.Common.Event.Freezer.TemperatureAlarm",),
             entity_category=EntityCategory.DIAGNOSTIC,
             device_class=BinarySensorDeviceClass.PROBLEM,
             value_on={"Present", "Confirmed"},
@@ -133,6 +85,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCBinarySensorEntityDescription(
             key="binary_sensor_refrigerator_defrost",
             entity="Refrigeration.Common.Status.Freezer.Defrost",
+            entity_aliases=("Refrigeration.FridgeFreezer.Status.DefrostFreezer",),
         ),
         HCBinarySensorEntityDescription(
             key="binary_sensor_water_filter_full",
@@ -142,10 +95,6 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             value_on={"Present", "Confirmed"},
             value_off={"Off"},
         ),
-        HCBinarySensorEntityDescription(
-            key="binary_sensor_refrigerator_defrost",
-            entity="Refrigeration.FridgeFreezer.Status.DefrostFreezer",
-        ),
         HCBinarySensorEntityDescription(
             key="binary_sensor_freezer_appliance_error",
             entity="Refrigeration.FridgeFreezer.Event.ApplianceError",
@@ -167,12 +116,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCSensorEntityDescription(
             key="sensor_temperature_ambient",
             entity="Refrigeration.FridgeFreezer.Status.TemperatureAmbient",
-            device_class=SensorDeviceClass.TEMPERATURE,
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        ),
-        HCSensorEntityDescription(
-            key="sensor_temperature_ambient",
-            entity="Refrigeration.Common.Status.TemperatureAmbient",
+            entity_aliases=("Refrigeration.Common.Status.TemperatureAmbient",),
             device_class=SensorDeviceClass.TEMPERATURE,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         ),
@@ -188,6 +132,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCNumberEntityDescription(
             key="number_setpoint_freezer",
             entity="Refrigeration.FridgeFreezer.Setting.SetpointTemperatureFreezer",
+            entity_aliases=("Refrigeration.Common.Setting.Freezer.SetpointTemperature",),
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             device_class=NumberDeviceClass.TEMPERATURE,
             mode=NumberMode.AUTO,
@@ -196,14 +141,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCNumberEntityDescription(
             key="number_setpoint_refrigerator",
             entity="Refrigeration.FridgeFreezer.Setting.SetpointTemperatureRefrigerator",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            mode=NumberMode.AUTO,
-            step=1,
-        ),
-        HCNumberEntityDescription(
-            key="number_setpoint_freezer",
-            entity="Refrigeration.Common.Setting.Freezer.SetpointTemperature",
+            entity_aliases=("Refrigeration.Common.Setting.Refrigerator.SetpointTemperature",),
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             device_class=NumberDeviceClass.TEMPERATURE,
             mode=NumberMode.AUTO,
@@ -218,14 +156,6 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             mode=NumberMode.AUTO,
             step=1,
         ),
-        HCNumberEntityDescription(
-            key="number_setpoint_refrigerator",
-            entity="Refrigeration.Common.Setting.Refrigerator.SetpointTemperature",
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            mode=NumberMode.AUTO,
-            step=1,
-        ),
         HCNumberEntityDescription(
             key="number_setpoint_refrigerator_fahrenheit",
             translation_key="number_setpoint_refrigerator",
@@ -268,41 +198,25 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCSwitchEntityDescription(
             key="switch_super_freezer",
             entity="Refrigeration.FridgeFreezer.Setting.SuperModeFreezer",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_super_freezer",
-            entity="Refrigeration.Common.Setting.Freezer.SuperMode",
+            entity_aliases=("Refrigeration.Common.Setting.Freezer.SuperMode",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
             key="switch_super_refrigerator",
             entity="Refrigeration.FridgeFreezer.Setting.SuperModeRefrigerator",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_super_refrigerator",
-            entity="Refrigeration.Common.Setting.Refrigerator.SuperMode",
+            entity_aliases=("Refrigeration.Common.Setting.Refrigerator.SuperMode",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
             key="switch_refrigerator_eco",
             entity="Refrigeration.FridgeFreezer.Setting.EcoMode",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_refrigerator_eco",
-            entity="Refrigeration.Common.Setting.EcoMode",
+            entity_aliases=("Refrigeration.Common.Setting.EcoMode",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
             key="switch_refrigerator_vacation",
             entity="Refrigeration.FridgeFreezer.Setting.VacationMode",
-            device_class=SwitchDeviceClass.SWITCH,
-        ),
-        HCSwitchEntityDescription(
-            key="switch_refrigerator_vacation",
-            entity="Refrigeration.Common.Setting.VacationMode",
+            entity_aliases=("Refrigeration.Common.Setting.VacationMode",),
             device_class=SwitchDeviceClass.SWITCH,
         ),
         HCSwitchEntityDescription(
@@ -313,6 +227,7 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
         HCSwitchEntityDescription(
             key="switch_refrigerator_sabbath_mode",
             entity="Refrigeration.Common.Setting.SabbathMode",
+            entity_aliases=("Refrigeration.FridgeFreezer.Setting.SabbathMode",),
             device_class=SwitchDeviceClass.SWITCH,
             entity_category=EntityCategory.CONFIG,
         ),
@@ -333,12 +248,6 @@ REFRIGERATION_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             entity="Refrigeration.Common.Setting.Light.Internal.EnableTheaterMode",
             device_class=SwitchDeviceClass.SWITCH,
         ),
-        HCSwitchEntityDescription(
-            key="switch_refrigerator_sabbath_mode",
-            entity="Refrigeration.FridgeFreezer.Setting.SabbathMode",
-            device_class=SwitchDeviceClass.SWITCH,
-            entity_category=EntityCategory.CONFIG,
-        ),
         HCSwitchEntityDescription(
             key="switch_refrigerator_fresh_mode",
             entity="Refrigeration.FridgeFreezer.Setting.FreshMode",
@@ -8,11 +8,10 @@ from typing import TYPE_CHECKING, Any, NamedTuple
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.util.percentage import percentage_to_ranged_value, ranged_value_to_percentage
-from homeconnect_websocket.message import Action, Message
 
 from .const import DOMAIN
 from .entity import HCEntity
-from .helpers import create_entities, error_decorator
+from .helpers import error_decorator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -39,8 +38,7 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up fan platform."""
-    entities = create_entities({"fan": HCFan}, config_entry.runtime_data)
-    async_add_entites(entities)
+    config_entry.runtime_data.reconciler.async_add_platform({"fan": HCFan}, async_add_entites)
 
 
 class HCFan(HCEntity, FanEntity):
@@ -49,7 +47,8 @@ class HCFan(HCEntity, FanEntity):
     entity_description: HCFanEntityDescription
     _speed_entities: dict[str, HcEntity] | None = None
     _speed_range: range = None
-    _speed_mapping: list[SpeedMapping]
+    _speed_mapping: dict[int, SpeedMapping]
+    _value_to_speed: dict[str, dict[int, int]]
 
     def __init__(
         self,
@@ -58,67 +57,54 @@ class HCFan(HCEntity, FanEntity):
     ) -> None:
         super().__init__(entity_description, runtime_data)
         self._attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_OFF
-        self._speed_mapping = []
+        self._speed_mapping = {}
+        self._value_to_speed = {}
         self._speed_entities = {}
         self._attr_speed_count = 0
         for entity_name in entity_description.entities:
             entity = self._runtime_data.appliance.entities[entity_name]
             self._speed_entities[entity_name] = entity
+            self._value_to_speed[entity_name] = {}
             for option in entity.enum:
                 if option != 0:
                     self._attr_speed_count += 1
-                    self._speed_mapping.append(
-                        SpeedMapping(
-                            entity_name=entity_name,
-                            entity_value=option,
-                            speed=self._attr_speed_count,
-                        )
+                    self._speed_mapping[self._attr_speed_count] = SpeedMapping(
+                        entity_name=entity_name,
+                        entity_value=option,
+                        speed=self._attr_speed_count,
                     )
+                    self._value_to_speed[entity_name][option] = self._attr_speed_count
 
         self._speed_range = (1, self._attr_speed_count)
 
     @property
     def percentage(self) -> int | None:
-        for speed in self._speed_mapping:
-            if self._speed_entities[speed.entity_name].value_raw == speed.entity_value:
-                return ranged_value_to_percentage(self._speed_range, speed.speed)
+        for entity_name, value_to_speed in self._value_to_speed.items():
+            speed = value_to_speed.get(self._speed_entities[entity_name].value_raw)
+            if speed is not None:
+                return ranged_value_to_percentage(self._speed_range, speed)
         return 0
 
+    async def _async_set_speed_values(self, entity_name: str | None, value: int) -> None:
+        """Set a speed Entity to value and all others to 0, unchanged Entities are not sent."""
+        async with self._runtime_data.batcher.batch() as batch:
+            for name, entity in self._speed_entities.items():
+                batch.set_value_raw(entity, value if name == entity_name else 0)
+
     @error_decorator
     async def async_set_percentage(self, percentage: int) -> None:
         new_speed = math.ceil(percentage_to_ranged_value(self._speed_range, percentage))
-        new_speed_entity: str = None
-        new_speed_value: int = None
-        for speed in self._speed_mapping:
-            if speed.speed == new_speed:
-                new_speed_entity = speed.entity_name
-                new_speed_value = speed.entity_value
-        if new_speed_entity or new_speed == 0:
-            data = []
-            for entity in self._speed_entities.values():
-                if entity.name == new_speed_entity:
-                    data.append({"uid": entity.uid, "value": new_speed_value})
-                else:
-                    data.append({"uid": entity.uid, "value": 0})
-            message = Message(
-                resource="/ro/values",
-                action=Action.POST,
-                data=data,
-            )
-            await self._runtime_data.appliance.session.send_sync(message)
+        if new_speed == 0:
+            await self._async_set_speed_values(None, 0)
+        elif speed := self._speed_mapping.get(new_speed):
+            await self._async_set_speed_values(speed.entity_name, speed.entity_value)
         else:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="speed_invalid",
-                translation_placeholders={"percentage", percentage},
+                translation_placeholders={"percentage": str(percentage)},
             )
 
     @error_decorator
     async def async_turn_off(self, **kwargs: Any) -> None:
-        data = [{"uid": entity.uid, "value": 0} for entity in self._speed_entities.values()]
-        message = Message(
-            resource="/ro/values",
-            action=Action.POST,
-            data=data,
-        )
-        await self._runtime_data.appliance.session.send_sync(message)
+        await self._async_set_speed_values(None, 0)
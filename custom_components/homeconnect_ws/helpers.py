@@ -2,39 +2,90 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import math
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.service import async_extract_config_entry_ids
+from homeconnect_websocket.entities import (
+    Access,
+    AccessMixin,
+    AvailableMixin,
+    MinMaxMixin,
+    Option,
+)
 from homeconnect_websocket.errors import AccessError, CodeResponsError, NotConnectedError
 
-from .const import DOMAIN
+from .compat import convert_value_raw
+from .const import DOMAIN, MAX_PARALLEL_SERVICE_CALLS
 
 if TYPE_CHECKING:
-    import re
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Callable, Container, Coroutine, Hashable
 
-    from homeassistant.core import HomeAssistant, ServiceCall
-    from homeconnect_websocket import HomeAppliance
-    from homeconnect_websocket.entities import Access
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+    from homeassistant.helpers.entity import EntityDescription
+    from homeconnect_websocket import DeviceDescription, HomeAppliance
     from homeconnect_websocket.entities import Entity as HcEntity
+    from homeconnect_websocket.entities import Program
 
     from . import HCConfigEntry, HCData
     from .entity import HCEntity
+    from .entity_descriptions import _EntityDescriptionsType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities used outside of entity descriptions
+ADDITIONAL_REFERENCED_ENTITIES = (
+    "BSH.Common.Option.StartInRelative",
+    "BSH.Common.Option.FinishInRelative",
+    "Cooking.Hood.Setting.ColorTemperature",
+)
+RE_FAVORITE_PROGRAM = re.compile(r"^BSH\.Common\.Program\.Favorite\.(.*)$")
+
+_INTERNED_DESCRIPTIONS: WeakValueDictionary[Hashable, EntityDescription] = WeakValueDictionary()
+# Interned descriptions by the frozen value of their mapping / options fields
+_INTERNED_VALUES: WeakValueDictionary[Hashable, EntityDescription] = WeakValueDictionary()
+
 
 def create_entities(
-    entities_classes: dict[str, type[HCEntity]], runtime_data: HCData
+    entities_classes: dict[str, type[HCEntity]],
+    runtime_data: HCData,
+    skip_unique_ids: Container[str] = (),
 ) -> set[HCEntity]:
-    """Create entities from entity_descriptions."""
+    """
+    Create entities from entity_descriptions.
+
+    Skips entities disabled in the registry and entities with a unique id in skip_unique_ids.
+    """
+    coordinator = runtime_data.coordinator
+    disabled_unique_ids = {
+        entry.unique_id
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(coordinator.hass), coordinator.config_entry.entry_id
+        )
+        if entry.disabled
+    }
     entities = set()
     for entity_key, entity_class in entities_classes.items():
         if entity_key in runtime_data.available_entity_descriptions:
             for entity_description in runtime_data.available_entity_descriptions[entity_key]:
+                unique_id = f"{runtime_data.appliance.info['deviceID']}-{entity_description.key}"
+                if unique_id in skip_unique_ids:
+                    continue
+                if unique_id in disabled_unique_ids:
+                    # Created on the reload after the entity gets enabled
+                    _LOGGER.debug("Skipping disabled Entity %s", entity_description.key)
+                    continue
                 _LOGGER.debug("Creating Entity %s", entity_description.key)
                 try:
                     entity = entity_class(
@@ -59,6 +110,50 @@ def merge_dicts(*args: dict[str, list]) -> dict[str, list]:
     return out_dict
 
 
+def _freeze(value: Any) -> Hashable:
+    """Get a hashable representation of a description field."""
+    if isinstance(value, Mapping):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def intern_description[T: EntityDescription](description: T) -> T:
+    """
+    Get a shared instance of a generated entity description.
+
+    Descriptions with identical content (e.g. from identical appliances) resolve to the same
+    instance, `mapping` and `options` are replaced by shared read-only copies.
+    Both pools only hold weak references, so unused descriptions and values are dropped.
+    """
+    frozen = {
+        field.name: _freeze(getattr(description, field.name)) for field in fields(description)
+    }
+    key = (type(description), tuple(frozen.items()))
+    if (interned := _INTERNED_DESCRIPTIONS.get(key)) is not None:
+        return interned
+
+    changes = {}
+    for field_name in ("mapping", "options"):
+        if (value := getattr(description, field_name, None)) is None:
+            continue
+        value_key = (field_name, frozen[field_name])
+        if (holder := _INTERNED_VALUES.get(value_key)) is not None:
+            changes[field_name] = getattr(holder, field_name)
+        elif isinstance(value, Mapping):
+            changes[field_name] = MappingProxyType(dict(value))
+        else:
+            changes[field_name] = tuple(value)
+    interned = replace(description, **changes) if changes else description
+    _INTERNED_DESCRIPTIONS[key] = interned
+    for field_name in changes:
+        _INTERNED_VALUES.setdefault((field_name, frozen[field_name]), interned)
+    return interned
+
+
 @dataclass
 class EntityMatch:
     """Returned by get_entities_from_regex."""
@@ -85,16 +180,164 @@ def get_groups_from_regex(appliance: HomeAppliance, pattern: re.Pattern) -> set[
     return groups
 
 
-async def get_config_entry_from_call(
+def get_referenced_entities(available_entity_descriptions: _EntityDescriptionsType) -> set[str]:
+    """Get the names of all HC entities used by the available entity descriptions."""
+    referenced_entities = set(ADDITIONAL_REFERENCED_ENTITIES)
+    for descriptions in available_entity_descriptions.values():
+        for description in descriptions:
+            if description.entity:
+                referenced_entities.add(description.entity)
+            if description.entities:
+                referenced_entities.update(description.entities)
+            if description.extra_attributes:
+                referenced_entities.update(
+                    extra_attribute["entity"] for extra_attribute in description.extra_attributes
+                )
+            for field_name in (
+                "brightness_entity",
+                "color_temperature_entity",
+                "color_entity",
+                "color_mode_entity",
+            ):
+                if entity := getattr(description, field_name, None):
+                    referenced_entities.add(entity)
+            if mapping := getattr(description, "mapping", None):
+                # Program select and active program sensor
+                referenced_entities.update(mapping)
+    return referenced_entities
+
+
+def get_favorite_name_entity(appliance: HomeAppliance, program: str) -> HcEntity | None:
+    """Get the setting holding the user defined name of a favorite program."""
+    if match := RE_FAVORITE_PROGRAM.match(program):
+        return appliance.settings.get(f"BSH.Common.Setting.Favorite.{match.groups()[0]}.Name")
+    return None
+
+
+def get_program_name(program: str, favorite_name_entity: HcEntity | None = None) -> str:
+    """Get the displayed name of a program."""
+    if favorite_name_entity and favorite_name_entity.value:
+        return favorite_name_entity.value
+    if match := RE_FAVORITE_PROGRAM.match(program):
+        return f"favorite_{match.groups()[0]}"
+    return program.lower().replace(".", "_")
+
+
+def copy_description(description: DeviceDescription) -> DeviceDescription:
+    """
+    Copy a device description for a new HomeAppliance.
+
+    HomeAppliance only mutates the info of its description, all entity descriptions are shared.
+    """
+    return {**description, "info": {**description.get("info", {})}}
+
+
+def compact_description(
+    description: DeviceDescription, referenced_entities: set[str]
+) -> DeviceDescription:
+    """Reduce a device description to the referenced entities and the options of their programs."""
+    referenced_entities = set(referenced_entities)
+    option_uids = set()
+    for program in description.get("program", []):
+        if program["name"] in referenced_entities:
+            option_uids.update(option["refUID"] for option in program.get("options", []))
+            if match := RE_FAVORITE_PROGRAM.match(program["name"]):
+                referenced_entities.add(f"BSH.Common.Setting.Favorite.{match.groups()[0]}.Name")
+
+    compacted_description: DeviceDescription = {}
+    for key, value in description.items():
+        if isinstance(value, list):
+            compacted_description[key] = [
+                entity
+                for entity in value
+                if entity["name"] in referenced_entities or entity["uid"] in option_uids
+            ]
+        else:
+            # info, activeProgram, selectedProgram, protectionPort
+            compacted_description[key] = value
+    return compacted_description
+
+
+async def get_config_entries_from_call(
     hass: HomeAssistant, service_call: ServiceCall
-) -> HCConfigEntry | None:
-    """Get the config entry from a service call."""
+) -> list[HCConfigEntry]:
+    """Get all config entries targeted by a service call."""
     config_entry_ids = await async_extract_config_entry_ids(service_call)
-    for config_entry_id in config_entry_ids:
-        config_entry = hass.config_entries.async_get_entry(config_entry_id)
-        if config_entry.domain == DOMAIN:
-            return config_entry
-    raise ServiceValidationError(translation_domain=DOMAIN, translation_key="not_appliance")
+    config_entries = [
+        config_entry
+        for config_entry_id in config_entry_ids
+        if (config_entry := hass.config_entries.async_get_entry(config_entry_id))
+        and config_entry.domain == DOMAIN
+    ]
+    if not config_entries:
+        raise ServiceValidationError(translation_domain=DOMAIN, translation_key="not_appliance")
+    return config_entries
+
+
+def fan_out_service(
+    hass: HomeAssistant,
+    func: Callable[[HCConfigEntry, ServiceCall], Coroutine[dict[str, Any] | None]],
+) -> Callable[[ServiceCall], Coroutine[ServiceResponse]]:
+    """
+    Create a service handler running func on all targeted Appliances concurrently.
+
+    The response contains the result and duration per device, merged with the data returned
+    by func. Errors are logged per Appliance. The first error is raised if func failed on all
+    Appliances, if it failed on some, an error listing them is raised unless a response
+    was requested.
+    """
+
+    async def handle(service_call: ServiceCall) -> ServiceResponse:
+        config_entries = await get_config_entries_from_call(hass, service_call)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_SERVICE_CALLS)
+
+        async def run(
+            config_entry: HCConfigEntry,
+        ) -> tuple[HomeAssistantError | None, float, dict[str, Any] | None]:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    data = await func(config_entry, service_call)
+                except HomeAssistantError as exc:
+                    return exc, time.perf_counter() - start, None
+                return None, time.perf_counter() - start, data
+
+        results = await asyncio.gather(*(run(config_entry) for config_entry in config_entries))
+
+        device_registry = dr.async_get(hass)
+        response = {}
+        failed = []
+        for config_entry, (error, duration, data) in zip(config_entries, results, strict=True):
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, config_entry.unique_id)}
+            )
+            if error is not None:
+                name = (device.name_by_user or device.name) if device else None
+                failed.append(name or config_entry.title)
+                _LOGGER.warning(
+                    "Service %s failed on %s: %s", service_call.service, failed[-1], error
+                )
+            response[device.id if device else config_entry.entry_id] = {
+                "success": error is None,
+                "error": str(error) if error is not None else None,
+                "duration": round(duration * 1000, 1),
+                **(data or {}),
+            }
+
+        if len(failed) == len(config_entries):
+            raise next(error for error, _, _ in results if error is not None)
+        if failed and not service_call.return_response:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="service_failed",
+                translation_placeholders={
+                    "service": service_call.service,
+                    "appliances": ", ".join(failed),
+                },
+            )
+        return response
+
+    return handle
 
 
 def entity_is_available(entity: HcEntity, available_access: tuple[Access]) -> bool:
@@ -108,6 +351,115 @@ def entity_is_available(entity: HcEntity, available_access: tuple[Access]) -> bo
     return available
 
 
+def resolve_value(entity: HcEntity, value: Any) -> Any:
+    """Resolve an enum value to its raw value, like Entity.set_value."""
+    if entity.enum:
+        for value_raw, enum_value in entity.enum.items():
+            if enum_value == value:
+                return value_raw
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="value_not_in_enum",
+            translation_placeholders={"value": str(value), "entity": entity.name},
+        )
+    return value
+
+
+def validate_value_raw(entity: HcEntity, value_raw: Any) -> None:
+    """Check a raw value against access, availability, enum, min, max and step of an Entity."""
+    if (
+        isinstance(entity, AccessMixin)
+        and entity.access not in (Access.READ_WRITE, Access.WRITE_ONLY)
+    ) or (isinstance(entity, AvailableMixin) and not entity.available):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="access_error",
+        )
+    if entity.enum:
+        if value_raw not in entity.enum:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="value_not_in_enum",
+                translation_placeholders={"value": str(value_raw), "entity": entity.name},
+            )
+        return
+    if (
+        not isinstance(entity, MinMaxMixin)
+        or isinstance(value_raw, bool)
+        or not isinstance(value_raw, int | float)
+    ):
+        return
+    minimum = entity.min if entity.min is not None else -math.inf
+    maximum = entity.max if entity.max is not None else math.inf
+    if not minimum <= value_raw <= maximum:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="value_out_of_range",
+            translation_placeholders={
+                "value": f"{value_raw:g}",
+                "entity": entity.name,
+                "min": f"{minimum:g}",
+                "max": f"{maximum:g}",
+            },
+        )
+    if entity.step:
+        steps = (value_raw - (entity.min or 0)) / entity.step
+        if not math.isclose(steps, round(steps), abs_tol=1e-6):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="value_invalid_step",
+                translation_placeholders={
+                    "value": f"{value_raw:g}",
+                    "entity": entity.name,
+                    "step": f"{entity.step:g}",
+                },
+            )
+
+
+def get_program_or_raise(appliance: HomeAppliance, key: str) -> Program:
+    """Get a Program of an Appliance, raise if it doesn't exist."""
+    program = appliance.programs.get(key)
+    if not program:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="program_not_available",
+            translation_placeholders={"program": key},
+        )
+    return program
+
+
+def get_options_or_raise(
+    appliance: HomeAppliance, options: Mapping[str, Any], *, validate: bool = True
+) -> dict[int, Any]:
+    """
+    Validate Program Options by key, returns the raw values by uid.
+
+    Access, availability, min, max and step of Options are reported for the selected Program,
+    set validate to False for Options of another Program, these are only converted.
+    """
+    options_raw = {}
+    for key, value in options.items():
+        entity = appliance.entities.get(key)
+        if not isinstance(entity, Option):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="option_not_available",
+                translation_placeholders={"option": key},
+            )
+        try:
+            value_raw = convert_value_raw(entity, resolve_value(entity, value))
+        except (ValueError, TypeError):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="option_value_invalid",
+                translation_placeholders={"value": str(value), "option": key},
+            ) from None
+        if validate:
+            validate_value_raw(entity, value_raw)
+        options_raw[entity.uid] = value_raw
+    return options_raw
+
+
 def error_decorator[T](func: Callable[..., Coroutine[T]]) -> Callable[..., Coroutine[T]]:
     """Catches HomeConnect Errors and raise HomeAssistantError."""
 
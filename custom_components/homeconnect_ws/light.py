@@ -20,11 +20,9 @@ from homeassistant.util.color import (
     value_to_brightness,
 )
 from homeassistant.util.scaling import scale_ranged_value_to_int_range
-from homeconnect_websocket.message import Action
-from homeconnect_websocket.message import Message as HC_Message
 
 from .entity import HCEntity
-from .helpers import create_entities, entity_is_available, error_decorator
+from .helpers import entity_is_available, error_decorator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -43,8 +41,7 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up light platform."""
-    entities = create_entities({"light": HCLight}, config_entry.runtime_data)
-    async_add_entites(entities)
+    config_entry.runtime_data.reconciler.async_add_platform({"light": HCLight}, async_add_entites)
 
 
 class HCLight(HCEntity, LightEntity):
@@ -56,6 +53,7 @@ class HCLight(HCEntity, LightEntity):
     _color_entity: HcEntity | None = None
     _color_mode_entity: HcEntity | None = None
     _color_temp_inverted: bool = False
+    _parsed_color: tuple[str, list[int]] | None = None
 
     def __init__(
         self,
@@ -124,13 +122,20 @@ class HCLight(HCEntity, LightEntity):
 
     @property
     def is_on(self) -> bool | None:
-        return bool(self._entity.value)
+        return bool(self._value)
+
+    @property
+    def _rgb(self) -> list[int]:
+        """Parsed value of the color Entity, only parsed again when the value changed."""
+        value = self._color_entity.value
+        if self._parsed_color is None or self._parsed_color[0] != value:
+            self._parsed_color = (value, rgb_hex_to_rgb_list(value.strip("#")))
+        return self._parsed_color[1]
 
     @property
     def brightness(self) -> int | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
-            return max(rgb)
+            return max(self._rgb)
         if self._brightness_entity is not None:
             return value_to_brightness((1, 100), self._brightness_entity.value)
         return None
@@ -155,34 +160,24 @@ class HCLight(HCEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
-            return match_max_scale((255,), rgb)
+            return match_max_scale((255,), self._rgb)
         return None
 
     @error_decorator
     async def async_turn_on(self, **kwargs: Any) -> None:
-        message = HC_Message(
-            resource="/ro/values",
-            action=Action.POST,
-            data=[],
-        )
-        brightness = kwargs.get(ATTR_BRIGHTNESS, self.brightness)
-        rgb = kwargs.get(ATTR_RGB_COLOR, self.rgb_color)
+        # Values are written in one batch, the batcher skips values
+        # the Appliance already reports or that are in flight
+        values: list[tuple[HcEntity, Any]] = []
 
         if self._attr_color_mode == ColorMode.RGB:
+            brightness = kwargs.get(ATTR_BRIGHTNESS, self.brightness)
+            rgb = kwargs.get(ATTR_RGB_COLOR, self.rgb_color)
             rgb_with_brightness = tuple(color * brightness // 255 for color in rgb)
-            message.data.append(
-                {
-                    "uid": self._color_entity.uid,
-                    "value": "#" + color_rgb_to_hex(*rgb_with_brightness),
-                }
-            )
-            if (
-                self._color_mode_entity is not None
-                and self._color_mode_entity.value != "CustomColor"
-            ):
-                color_mode_value = self._color_mode_entity._rev_enumeration["CustomColor"]  # noqa: SLF001
-                message.data.append({"uid": self._color_mode_entity.uid, "value": color_mode_value})
+            color = "#" + color_rgb_to_hex(*rgb_with_brightness)
+            if str(self._color_entity.value_raw).lower() == color:
+                # Keep the case reported by the Appliance
+                color = self._color_entity.value_raw
+            values.append((self._color_entity, color))
 
         elif (
             self._attr_color_mode in (ColorMode.BRIGHTNESS, ColorMode.COLOR_TEMP)
@@ -190,11 +185,11 @@ class HCLight(HCEntity, LightEntity):
         ):
             value_in_range = int(
                 max(
-                    brightness_to_value((1, 100), brightness),
+                    brightness_to_value((1, 100), kwargs[ATTR_BRIGHTNESS]),
                     self._brightness_entity.min,
                 )
             )
-            message.data.append({"uid": self._brightness_entity.uid, "value": value_in_range})
+            values.append((self._brightness_entity, value_in_range))
 
         if ATTR_COLOR_TEMP_KELVIN in kwargs:
             if self._color_temp_inverted:
@@ -213,14 +208,21 @@ class HCLight(HCEntity, LightEntity):
                         kwargs[ATTR_COLOR_TEMP_KELVIN],
                     )
                 )
-            message.data.append(
-                {"uid": self._color_temperature_entity.uid, "value": value_in_range}
-            )
+            values.append((self._color_temperature_entity, value_in_range))
+
+        async def write() -> None:
+            async with self._runtime_data.batcher.batch() as batch:
+                for entity, value in values:
+                    batch.set_value_raw(entity, value)
+                if self._attr_color_mode == ColorMode.RGB and self._color_mode_entity is not None:
+                    batch.set_value(self._color_mode_entity, "CustomColor")
+                batch.set_value(self._entity, True)  # noqa: FBT003
 
-        if self._entity.value is not True:
-            message.data.append({"uid": self._entity.uid, "value": True})
-        await self._runtime_data.appliance.session.send_sync(message)
+        await self.async_write_optimistic(True, write())  # noqa: FBT003
 
     @error_decorator
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._entity.set_value(False)
+        await self.async_write_optimistic(
+            False,  # noqa: FBT003
+            self._runtime_data.batcher.async_set_value(self._entity, False),  # noqa: FBT003
+        )
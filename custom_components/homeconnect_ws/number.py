@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from homeassistant.components.number import DEFAULT_MAX_VALUE, DEFAULT_MIN_VALUE, NumberEntity
 
 from .entity import HCEntity
-from .helpers import create_entities, error_decorator
+from .helpers import error_decorator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -25,8 +25,7 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up number platform."""
-    entities = create_entities({"number": HCNumber}, config_entry.runtime_data)
-    async_add_entites(entities)
+    config_entry.runtime_data.reconciler.async_add_platform({"number": HCNumber}, async_add_entites)
 
 
 class HCNumber(HCEntity, NumberEntity):
@@ -44,7 +43,7 @@ class HCNumber(HCEntity, NumberEntity):
 
     @property
     def native_value(self) -> int | float:
-        return self._entity.value
+        return self._value
 
     @property
     def native_min_value(self) -> float:
@@ -70,4 +69,6 @@ class HCNumber(HCEntity, NumberEntity):
 
     @error_decorator
     async def async_set_native_value(self, value: float) -> None:
-        await self._entity.set_value(int(value))
+        await self.async_write_optimistic(
+            int(value), self._runtime_data.batcher.async_set_value(self._entity, int(value))
+        )
@@ -0,0 +1,132 @@
+"""Incremental Entity reconciliation."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from . import entity_descriptions
+from .helpers import create_entities
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from . import HCConfigEntry
+    from .entity import HCEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconciledPlatform:
+    """Entities of a platform managed by the reconciler."""
+
+    entity_classes: dict[str, type[HCEntity]]
+    async_add_entities: AddEntitiesCallback
+    entities: dict[str, HCEntity] = field(default_factory=dict)
+
+
+class EntityReconciler:
+    """
+    Keep the Entities of a config entry in sync with the available entity descriptions.
+
+    Entities are diffed by unique id, only added, removed or changed Entities are touched.
+    Removed Entities keep their registry entry, so a description that is only missing
+    temporarily never loses user customizations.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: HCConfigEntry) -> None:
+        """Initialize the reconciler."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._ready = False
+        self.platforms: list[ReconciledPlatform] = []
+
+    @callback
+    def async_add_platform(
+        self,
+        entity_classes: dict[str, type[HCEntity]],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Register the entity classes of a platform and add its Entities."""
+        platform = ReconciledPlatform(entity_classes, async_add_entities)
+        self.platforms.append(platform)
+        self._async_add_entities(platform)
+
+    @callback
+    def async_set_ready(self) -> None:
+        """Mark all platforms as set up."""
+        self._ready = True
+
+    @callback
+    def _async_add_entities(self, platform: ReconciledPlatform) -> int:
+        entities = create_entities(
+            platform.entity_classes,
+            self._config_entry.runtime_data,
+            skip_unique_ids=platform.entities,
+        )
+        for entity in entities:
+            platform.entities[entity.unique_id] = entity
+        if entities:
+            platform.async_add_entities(entities)
+        return len(entities)
+
+    async def async_reconcile(self) -> None:
+        """Add and remove Entities after the available entity descriptions changed."""
+        if not self._ready:
+            return
+        start = time.perf_counter()
+        runtime_data = self._config_entry.runtime_data
+        available_entities = entity_descriptions.get_available_entities(runtime_data.appliance)
+        if available_entities == runtime_data.available_entity_descriptions:
+            _LOGGER.debug("Entity descriptions of %s unchanged", self._config_entry.title)
+            return
+
+        handled_types = {
+            description_type
+            for platform in self.platforms
+            for description_type in platform.entity_classes
+        }
+        if any(
+            descriptions and description_type not in handled_types
+            for description_type, descriptions in available_entities.items()
+        ):
+            # New Entities need a platform that is not set up
+            _LOGGER.debug("Reloading %s to set up new platforms", self._config_entry.title)
+            self._hass.config_entries.async_schedule_reload(self._config_entry.entry_id)
+            return
+
+        device_id = runtime_data.appliance.info["deviceID"]
+        removed = 0
+        for platform in self.platforms:
+            descriptions = {
+                f"{device_id}-{description.key}": description
+                for description_type in platform.entity_classes
+                for description in available_entities.get(description_type, ())
+            }
+            for unique_id, entity in list(platform.entities.items()):
+                description = descriptions.get(unique_id)
+                if description == entity.entity_description or (
+                    description is not None and entity.async_update_entity_description(description)
+                ):
+                    continue
+                # Changed Entities are recreated, the registry entry is kept.
+                # Registry entries of removed Entities are left to the user to delete.
+                del platform.entities[unique_id]
+                await entity.async_remove()
+                removed += 1
+
+        runtime_data.available_entity_descriptions = available_entities
+        added = sum(self._async_add_entities(platform) for platform in self.platforms)
+        _LOGGER.debug(
+            "Reconciled Entities of %s in %.1f ms, %s removed, %s added",
+            self._config_entry.title,
+            (time.perf_counter() - start) * 1000,
+            removed,
+            added,
+        )
@@ -0,0 +1,116 @@
+"""Prioritized scheduling of outbound requests."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from .const import MAX_PARALLEL_REQUESTS
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+
+class Priority(IntEnum):
+    """Priority classes of outbound requests, lower is sent first."""
+
+    COMMAND = 0
+    PROGRAM = 1
+    SETTING = 2
+    DIAGNOSTIC = 3
+
+
+@dataclass
+class PriorityStats:
+    """Request counters of a priority class."""
+
+    requests: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+def get_entity_priority(entity: HcEntity) -> Priority:
+    """Get the priority of a value write to an Entity."""
+    if ".Command." in entity.name or entity.name == "BSH.Common.Setting.PowerState":
+        return Priority.COMMAND
+    if ".Root." in entity.name or ".Program." in entity.name:
+        return Priority.PROGRAM
+    return Priority.SETTING
+
+
+class RequestScheduler:
+    """
+    Send the requests of an Appliance by priority.
+
+    At most max_in_flight requests are sent at the same time, waiting requests
+    are started by priority and in arrival order within a priority.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_in_flight: int = MAX_PARALLEL_REQUESTS) -> None:
+        """Initialize the scheduler."""
+        self._loop = hass.loop
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._queue: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.stats = {priority: PriorityStats() for priority in Priority}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently sent."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be sent."""
+        return sum(stats.queued for stats in self.stats.values())
+
+    async def async_send[T](
+        self, priority: Priority, func: Callable[..., Awaitable[T]], *args: Any
+    ) -> T:
+        """Run a request once a slot is free."""
+        stats = self.stats[priority]
+        stats.requests += 1
+        start = time.monotonic()
+        if self._in_flight < self._max_in_flight and not self._queue:
+            self._in_flight += 1
+        else:
+            future = self._loop.create_future()
+            heapq.heappush(self._queue, (priority, next(self._sequence), future))
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # The slot was already handed over
+                    self._release()
+                raise
+            finally:
+                stats.queued -= 1
+        wait = time.monotonic() - start
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        try:
+            return await func(*args)
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the slot over to the next waiting request."""
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
@@ -7,8 +7,9 @@ from typing import TYPE_CHECKING
 from homeassistant.components.select import SelectEntity
 from homeconnect_websocket.entities import Execution
 
-from .entity import HCEntity
-from .helpers import create_entities, error_decorator
+from .entity import HCEntity, HCProgramEntity
+from .helpers import error_decorator
+from .scheduler import Priority
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -26,11 +27,9 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up select platform."""
-    entities = create_entities(
-        {"select": HCSelect, "program": HCProgram},
-        config_entry.runtime_data,
+    config_entry.runtime_data.reconciler.async_add_platform(
+        {"select": HCSelect, "program": HCProgram}, async_add_entites
     )
-    async_add_entites(entities)
 
 
 class HCSelect(HCEntity, SelectEntity):
@@ -48,7 +47,7 @@ class HCSelect(HCEntity, SelectEntity):
 
         self._rev_options = {}
         if entity_description.options:
-            self._attr_options = entity_description.options
+            self._attr_options = list(entity_description.options)
         elif self._entity.enum:
             self._attr_options = []
             if self.entity_description.has_state_translation:
@@ -65,10 +64,10 @@ class HCSelect(HCEntity, SelectEntity):
     @property
     def current_option(self) -> str:
         if self.entity_description.has_state_translation:
-            value = str(self._entity.value).lower()
+            value = str(self._value).lower()
             if value in self._attr_options:
                 return value
-        value = str(self._entity.value)
+        value = str(self._value)
         if value in self._attr_options:
             return value
         return None
@@ -77,23 +76,16 @@ class HCSelect(HCEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         if self._rev_options:
             option = self._rev_options[option]
-        await self._entity.set_value(option)
+        await self.async_write_optimistic(
+            option, self._runtime_data.batcher.async_set_value(self._entity, option)
+        )
 
 
-class HCProgram(HCSelect):
+class HCProgram(HCProgramEntity, HCSelect):
     """Program select Entity."""
 
     _entity: SelectedProgram
 
-    def __init__(
-        self,
-        entity_description: HCSelectEntityDescription,
-        runtime_data: HCData,
-    ) -> None:
-        super().__init__(entity_description, runtime_data)
-        self._programs = entity_description.mapping
-        self._rev_programs = {value: key for key, value in self._programs.items()}
-
     @property
     def options(self) -> list[str] | None:
         return list(self._programs.values())
@@ -110,6 +102,6 @@ class HCProgram(HCSelect):
     async def async_select_option(self, option: str) -> None:
         selected_program = self._runtime_data.appliance.programs[self._rev_programs[option]]
         if selected_program.execution in (Execution.SELECT_ONLY, Execution.SELECT_AND_START):
-            await selected_program.select()
+            await self._runtime_data.scheduler.async_send(Priority.PROGRAM, selected_program.select)
         elif selected_program.execution == Execution.START_ONLY:
-            await selected_program.start()
+            await self._runtime_data.scheduler.async_send(Priority.PROGRAM, selected_program.start)
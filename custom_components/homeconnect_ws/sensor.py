@@ -9,8 +9,8 @@ from aiohttp.client_exceptions import ClientConnectionResetError
 from homeassistant.components.sensor import SensorEntity
 from homeconnect_websocket import NotConnectedError
 
-from .entity import HCEntity
-from .helpers import create_entities
+from .entity import HCEntity, HCProgramEntity
+from .scheduler import Priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,16 +30,15 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up sensor platform."""
-    entities = create_entities(
+    config_entry.runtime_data.reconciler.async_add_platform(
         {
             "sensor": HCSensor,
             "event_sensor": HCEventSensor,
             "active_program": HCActiveProgram,
             "wifi": HCWiFI,
         },
-        config_entry.runtime_data,
+        async_add_entites,
     )
-    async_add_entites(entities)
 
 
 class HCSensor(HCEntity, SensorEntity):
@@ -89,26 +88,20 @@ class HCEventSensor(HCEntity, SensorEntity):
         return self._runtime_data.appliance.session.connected
 
 
-class HCActiveProgram(HCSensor):
+class HCActiveProgram(HCProgramEntity, HCSensor):
     """Active Program Sensor Entity."""
 
     entity_description: HCSensorEntityDescription
 
-    def __init__(
-        self,
-        entity_description: HCSensorEntityDescription,
-        runtime_data: HCData,
-    ) -> None:
-        super().__init__(entity_description, runtime_data)
-        self._attr_options = list(entity_description.mapping.values())
+    @property
+    def options(self) -> list[str]:
+        return list(self._programs.values())
 
     @property
     def native_value(self) -> str | None:
         if self._runtime_data.appliance.active_program:
-            if self._runtime_data.appliance.active_program.name in self.entity_description.mapping:
-                return self.entity_description.mapping[
-                    self._runtime_data.appliance.active_program.name
-                ]
+            if self._runtime_data.appliance.active_program.name in self._programs:
+                return self._programs[self._runtime_data.appliance.active_program.name]
             return self._runtime_data.appliance.active_program.name
         return None
 
@@ -127,7 +120,9 @@ class HCWiFI(HCEntity, SensorEntity):
 
     async def async_update(self) -> None:
         try:
-            network_info = await self._runtime_data.appliance.get_network_config()
+            network_info = await self._runtime_data.scheduler.async_send(
+                Priority.DIAGNOSTIC, self._runtime_data.appliance.get_network_config
+            )
             if network_info and isinstance(network_info, list) and "rssi" in network_info[0]:
                 self._attr_native_value = network_info[0]["rssi"]
             else:
@@ -0,0 +1,84 @@
+"""Versioned in-memory snapshot of Appliance values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from homeassistant.core import callback
+from homeconnect_websocket.entities import AccessMixin, AvailableMixin
+
+if TYPE_CHECKING:
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+
+class ValueSnapshot:
+    """
+    Track the changes of all Entities of an Appliance.
+
+    Every Entity update increases the version, so clients only have to read
+    the values changed since the last version they have seen.
+    Versions restart with every snapshot, the epoch identifies the snapshot they belong to.
+    Values are read from memory, the Appliance is never queried.
+    Entity updates are only tracked after the first request, Appliances
+    nobody reads the snapshot of don't pay for tracking.
+    """
+
+    def __init__(self, appliance: HomeAppliance) -> None:
+        """Initialize the snapshot."""
+        self._appliance = appliance
+        self._versions: dict[str, int] = {}
+        self._tracking = False
+        self.epoch = uuid4().hex
+        self.version = 0
+
+    @callback
+    def _async_start(self) -> None:
+        """Start tracking Entity updates."""
+        self._tracking = True
+        for entity in self._appliance.entities.values():
+            entity.register_callback(self._async_entity_updated)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking Entity updates."""
+        if not self._tracking:
+            return
+        self._tracking = False
+        for entity in self._appliance.entities.values():
+            entity.unregister_callback(self._async_entity_updated)
+
+    async def _async_entity_updated(self, entity: HcEntity) -> None:
+        self.version += 1
+        self._versions[entity.name] = self.version
+
+    @callback
+    def async_get_values(
+        self, prefix: str = "", since: int | None = None, epoch: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get the values of all Entities with a key starting with prefix.
+
+        If since is set only values changed after that version are returned,
+        all values are returned if epoch doesn't match the epoch of this snapshot.
+        """
+        if not self._tracking:
+            # Clients can't know a version of this snapshot yet
+            self._async_start()
+        if epoch != self.epoch:
+            # Versions of another snapshot, e.g. before a reload
+            since = None
+        values = {}
+        for name, entity in self._appliance.entities.items():
+            if not name.startswith(prefix):
+                continue
+            if since is not None and self._versions.get(name, 0) <= since:
+                continue
+            values[name] = {
+                "uid": entity.uid,
+                "value": entity.value,
+                "access": entity.access if isinstance(entity, AccessMixin) else None,
+                "available": entity.available if isinstance(entity, AvailableMixin) else None,
+            }
+        return {"epoch": self.epoch, "version": self.version, "values": values}
@@ -0,0 +1,163 @@
+"""Storage for Appliance descriptions."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from base64 import b64decode, b64encode
+from typing import TYPE_CHECKING, Final, TypedDict
+
+from homeassistant.helpers.json import json_bytes, json_bytes_sorted
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
+
+from .const import CONF_DESCRIPTION_HASH, DOMAIN, PROFILE_CACHE_MAX_SIZE
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION: Final = 1
+STORAGE_KEY: Final = f"{DOMAIN}.description"
+PROFILE_CACHE_DIR: Final = f"{DOMAIN}.profile_cache"
+PROFILE_CACHE_SUFFIX: Final = ".json.zlib"
+
+
+class StoredDescription(TypedDict):
+    """Stored compressed description."""
+
+    hash: str
+    description: str
+
+
+def _encode_description(description: DeviceDescription) -> StoredDescription:
+    raw_description = json_bytes_sorted(description)
+    return StoredDescription(
+        hash=hashlib.sha256(raw_description).hexdigest(),
+        description=b64encode(zlib.compress(raw_description, level=9)).decode(),
+    )
+
+
+def _decode_description(stored_description: StoredDescription) -> DeviceDescription:
+    return json_loads(zlib.decompress(b64decode(stored_description["description"])))
+
+
+def _get_store(hass: HomeAssistant, description_hash: str) -> Store[StoredDescription]:
+    return Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY}.{description_hash}", private=True, atomic_writes=True
+    )
+
+
+async def async_save_description(hass: HomeAssistant, description: DeviceDescription) -> str:
+    """Save a description and return its content hash."""
+    stored_description = await hass.async_add_executor_job(_encode_description, description)
+    description_hash = stored_description["hash"]
+    await _get_store(hass, description_hash).async_save(stored_description)
+    _LOGGER.debug("Saved description %s", description_hash)
+    return description_hash
+
+
+async def async_load_description(
+    hass: HomeAssistant, description_hash: str
+) -> DeviceDescription | None:
+    """Load a description by its content hash."""
+    stored_description = await _get_store(hass, description_hash).async_load()
+    if stored_description is None or stored_description.get("hash") != description_hash:
+        _LOGGER.debug("Description %s not found", description_hash)
+        return None
+    return await hass.async_add_executor_job(_decode_description, stored_description)
+
+
+async def async_remove_unused_description(
+    hass: HomeAssistant, description_hash: str | None, exclude_entry_id: str | None = None
+) -> None:
+    """Remove a stored description if no other config entry references it."""
+    if description_hash is None:
+        return
+    for entry in hass.config_entries.async_entries(DOMAIN, include_ignore=False):
+        if (
+            entry.entry_id != exclude_entry_id
+            and entry.data.get(CONF_DESCRIPTION_HASH) == description_hash
+        ):
+            return
+    _LOGGER.debug("Removing unused description %s", description_hash)
+    await _get_store(hass, description_hash).async_remove()
+
+
+class ProfileCache:
+    """
+    On-disk cache of parsed descriptions.
+
+    Entries are keyed by the content hash of the description and feature mapping file,
+    the least recently used entries are evicted once the cache exceeds max_size bytes.
+    Not async safe, run in the executor.
+    """
+
+    def __init__(self, path: Path, max_size: int = PROFILE_CACHE_MAX_SIZE) -> None:
+        """Initialize the cache."""
+        self._path = path
+        self._max_size = max_size
+
+    @staticmethod
+    def get_key(description_file_hash: bytes, feature_file_hash: bytes) -> str:
+        """Get cache key from the SHA-256 digests of a description and feature mapping file."""
+        key = hashlib.sha256()
+        key.update(description_file_hash)
+        key.update(feature_file_hash)
+        return key.hexdigest()
+
+    def _get_file(self, key: str) -> Path:
+        return self._path / f"{key}{PROFILE_CACHE_SUFFIX}"
+
+    def get(self, key: str) -> DeviceDescription | None:
+        """Get a cached description."""
+        cache_file = self._get_file(key)
+        try:
+            description = json_loads(zlib.decompress(cache_file.read_bytes()))
+            # Mark as recently used
+            os.utime(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error):
+            _LOGGER.debug("Invalid profile cache entry %s", key)
+            cache_file.unlink(missing_ok=True)
+            return None
+        return description
+
+    def set(self, key: str, description: DeviceDescription) -> None:
+        """Cache a description and evict least recently used entries."""
+        cache_file = self._get_file(key)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+        try:
+            data = zlib.compress(json_bytes(description))
+            self._path.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(data)
+            tmp_file.replace(cache_file)
+        except (OSError, TypeError) as exc:
+            _LOGGER.debug("Failed to cache description %s: %s", key, exc)
+            tmp_file.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for cache_file in self._path.glob(f"*{PROFILE_CACHE_SUFFIX}"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_file))
+        cache_size = sum(size for _, size, _ in entries)
+        for _, size, cache_file in sorted(entries):
+            if cache_size <= self._max_size:
+                break
+            _LOGGER.debug("Evicting profile cache entry %s", cache_file.name)
+            cache_file.unlink(missing_ok=True)
+            cache_size -= size
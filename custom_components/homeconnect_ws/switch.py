@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.switch import SwitchEntity
 
 from .entity import HCEntity
-from .helpers import create_entities, error_decorator
+from .helpers import error_decorator
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -25,8 +25,7 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up switch platform."""
-    entities = create_entities({"switch": HCSwitch}, config_entry.runtime_data)
-    async_add_entites(entities)
+    config_entry.runtime_data.reconciler.async_add_platform({"switch": HCSwitch}, async_add_entites)
 
 
 class HCSwitch(HCEntity, SwitchEntity):
@@ -44,24 +43,25 @@ class HCSwitch(HCEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
+        value = self._value
         if self._value_mapping:
-            if self._value_mapping[0] == self._entity.value:
+            if self._value_mapping[0] == value:
                 return True
-            if self._value_mapping[1] == self._entity.value:
+            if self._value_mapping[1] == value:
                 return False
             return None
-        return bool(self._entity.value)
+        return bool(value)
 
     @error_decorator
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[0])
-        else:
-            await self._entity.set_value(True)
+        value = self._value_mapping[0] if self._value_mapping else True
+        await self.async_write_optimistic(
+            value, self._runtime_data.batcher.async_set_value(self._entity, value)
+        )
 
     @error_decorator
     async def async_turn_off(self, **kwargs: Any) -> None:
-        if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[1])
-        else:
-            await self._entity.set_value(False)
+        value = self._value_mapping[1] if self._value_mapping else False
+        await self.async_write_optimistic(
+            value, self._runtime_data.batcher.async_set_value(self._entity, value)
+        )
@@ -0,0 +1,275 @@
+"""Tests for write batcher."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.batcher import WriteBatcher
+from custom_components.homeconnect_ws.const import DOMAIN
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+from homeconnect_websocket import CodeResponsError
+from homeconnect_websocket.message import Action, Message
+
+from . import setup_config_entry
+from .const import MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_merge_writes(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test concurrent writes are sent in one message."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    entities = mock_appliance.entities
+
+    await asyncio.gather(
+        batcher.async_set_value(entities["Test.Switch"], True),  # noqa: FBT003
+        batcher.async_set_value(entities["Test.Switch.Enum"], "On"),
+        batcher.async_set_value(entities["Test.Select"], "Option2"),
+        batcher.async_set_value(entities["Test.Number"], 6),
+        # Last write of an Entity wins
+        batcher.async_set_value(entities["Test.Number"], 10),
+    )
+
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[
+                {"uid": 201, "value": True},
+                {"uid": 202, "value": 1},
+                {"uid": 203, "value": 1},
+                {"uid": 204, "value": 10},
+            ],
+        )
+    )
+    assert batcher.writes == 5
+    assert batcher.messages == 1
+
+
+async def test_single_write(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test a single write is sent like Entity.set_value."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    await batcher.async_set_value(mock_appliance.entities["Test.Number"], 6)
+
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 204, "value": 6})
+    )
+
+
+async def test_merge_in_flight(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test a write is sent right away and writes queued while it is in flight are merged."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    entities = mock_appliance.entities
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+
+    first = hass.async_create_task(batcher.async_set_value(entities["Test.Number"], 6))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    mock_appliance.session.send_sync.assert_awaited_once()
+
+    queued = [
+        hass.async_create_task(batcher.async_set_value(entities["Test.Number"], 8)),
+        hass.async_create_task(batcher.async_set_value(entities["Test.Select"], "Option2")),
+    ]
+    await asyncio.sleep(0)
+    mock_appliance.session.send_sync.assert_awaited_once()
+
+    release.set()
+    await asyncio.gather(first, *queued)
+    assert mock_appliance.session.send_sync.await_args_list[1].args[0] == Message(
+        resource="/ro/values",
+        action=Action.POST,
+        data=[{"uid": 204, "value": 8}, {"uid": 203, "value": 1}],
+    )
+    assert batcher.messages == 2
+
+
+async def test_rejected_batch(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test each caller gets its own result when a merged message is rejected."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    entities = mock_appliance.entities
+    error = CodeResponsError(400, "/ro/values")
+    mock_appliance.session.send_sync.side_effect = [error, None, error]
+
+    results = await asyncio.gather(
+        batcher.async_set_value(entities["Test.Switch"], True),  # noqa: FBT003
+        batcher.async_set_value(entities["Test.Number"], 6),
+        return_exceptions=True,
+    )
+
+    assert results == [None, error]
+    assert batcher.messages == 3
+
+
+async def test_batch_context(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test writes inside a batch context are sent on exit."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    entities = mock_appliance.entities
+
+    async with batcher.batch() as batch:
+        batch.set_value(entities["Test.Switch"], False)  # noqa: FBT003
+        await asyncio.sleep(0.01)
+        batch.set_value_raw(entities["Test.Number"], 4)
+        mock_appliance.session.send_sync.assert_not_awaited()
+
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[{"uid": 201, "value": False}, {"uid": 204, "value": 4}],
+        )
+    )
+
+
+async def test_invalid_write(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test invalid writes fail before queuing."""
+    batcher = WriteBatcher(hass, mock_appliance)
+
+    entities = mock_appliance.entities
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value(entities["Test.RegEx.001.Sensor"], 1)
+    assert exc_info.value.translation_key == "access_error"
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value(entities["Test.Select"], "Option4")
+    assert exc_info.value.translation_key == "value_not_in_enum"
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value_raw(entities["Test.Select"], 4)
+    assert exc_info.value.translation_key == "value_not_in_enum"
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value(entities["Test.Number"], 22)
+    assert exc_info.value.translation_key == "value_out_of_range"
+    assert exc_info.value.translation_placeholders == {
+        "value": "22",
+        "entity": "Test.Number",
+        "min": "0",
+        "max": "20",
+    }
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value(entities["Test.Number"], 5)
+    assert exc_info.value.translation_key == "value_invalid_step"
+    await entities["Test.Number"].update({"available": False})
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await batcher.async_set_value(entities["Test.Number"], 6)
+    assert exc_info.value.translation_key == "access_error"
+
+    assert batcher.writes == 0
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def test_suppress_noop_writes(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test writes of the current value are only sent when forced."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    entities = mock_appliance.entities
+    await entities["Test.Number"].update({"value": 6})
+    await entities["Test.Select"].update({"value": 1})
+
+    await batcher.async_set_value(entities["Test.Number"], 6)
+    await batcher.async_set_value(entities["Test.Select"], "Option2")
+    mock_appliance.session.send_sync.assert_not_awaited()
+    assert batcher.suppressed == 2
+
+    await batcher.async_set_value(entities["Test.Number"], 6, force=True)
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 204, "value": 6})
+    )
+    mock_appliance.session.send_sync.reset_mock()
+
+    # Reverting a queued write is still sent
+    await asyncio.gather(
+        batcher.async_set_value(entities["Test.Number"], 10),
+        batcher.async_set_value(entities["Test.Number"], 6),
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 204, "value": 6})
+    )
+    assert batcher.suppressed == 2
+
+
+async def test_noop_write_in_flight(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test writes are compared against the value in flight, not the confirmed value."""
+    batcher = WriteBatcher(hass, mock_appliance)
+    number = mock_appliance.entities["Test.Number"]
+    await number.update({"value": 6})
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+
+    # 6 -> 8 -> 6, the write back to the confirmed value is still sent
+    write_8 = hass.async_create_task(batcher.async_set_value(number, 8))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    # The write of the value in flight waits for it
+    write_8_again = hass.async_create_task(batcher.async_set_value(number, 8))
+    write_6 = hass.async_create_task(batcher.async_set_value(number, 6))
+    await asyncio.sleep(0)
+    assert batcher.suppressed == 1
+
+    release.set()
+    await asyncio.gather(write_8, write_6, write_8_again)
+    assert [call.args[0].data for call in mock_appliance.session.send_sync.await_args_list] == [
+        {"uid": 204, "value": 8},
+        {"uid": 204, "value": 6},
+    ]
+
+
+async def test_apply_scene(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test applying a scene merges the writes queued while a message is in flight."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    assert await async_setup_component(hass, "scene", {"scene": {"platform": "homeassistant"}})
+    await hass.async_block_till_done()
+    batcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.batcher
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+
+    apply = hass.async_create_task(
+        hass.services.async_call(
+            "scene",
+            "apply",
+            {
+                "entities": {
+                    "switch.fake_brand_homeappliance_switch": "on",
+                    "number.fake_brand_homeappliance_number": "10",
+                    "select.fake_brand_homeappliance_select": "Option3",
+                }
+            },
+            blocking=True,
+        )
+    )
+    async with asyncio.timeout(1):
+        while batcher.writes < 3:  # noqa: ASYNC110
+            await asyncio.sleep(0)
+    release.set()
+    await apply
+
+    sent = []
+    for call in mock_appliance.session.send_sync.await_args_list:
+        data = call.args[0].data
+        sent.extend(data if isinstance(data, list) else [data])
+    assert sorted(sent, key=lambda value: value["uid"]) == [
+        {"uid": 201, "value": True},
+        {"uid": 203, "value": 2},
+        {"uid": 204, "value": 10},
+    ]
+    assert batcher.messages < 3
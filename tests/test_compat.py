@@ -0,0 +1,47 @@
+"""Tests for private homeconnect_websocket access."""
+
+from __future__ import annotations
+
+import json
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.compat import convert_value_raw, set_value_shadow
+
+if TYPE_CHECKING:
+    from homeconnect_websocket.testutils import MockAppliance
+
+MANIFEST = Path(__file__).parent.parent / "custom_components" / "homeconnect_ws" / "manifest.json"
+
+
+def test_library_version() -> None:
+    """Test the installed library is the version the compatibility functions are pinned to."""
+    requirements = json.loads(MANIFEST.read_text())["requirements"]
+    assert f"homeconnect-websocket=={version('homeconnect-websocket')}" in requirements
+
+
+def test_convert_value_raw(mock_appliance: MockAppliance) -> None:
+    """Test values are converted to the protocol type of the Entity."""
+    entities = mock_appliance.entities
+    assert convert_value_raw(entities["Test.LightingBrightness"], "50") == 50.0
+    assert isinstance(convert_value_raw(entities["Test.LightingBrightness"], 50), float)
+    assert convert_value_raw(entities["Test.LightingColor"], "33") == 33
+    assert convert_value_raw(entities["Test.Lighting"], "true") is True
+    # Entities without protocol type keep the value
+    assert convert_value_raw(entities["Test.Option1"], "abc") == "abc"
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        convert_value_raw(entities["Test.LightingColor"], "abc")
+    with pytest.raises(TypeError):
+        convert_value_raw(entities["Test.Lighting"], None)
+
+
+def test_set_value_shadow(mock_appliance: MockAppliance) -> None:
+    """Test setting the shadow value keeps the reported value."""
+    entity = mock_appliance.entities["Test.LightingBrightness"]
+    set_value_shadow(entity, 80.0)
+
+    assert entity.value_shadow == 80.0
+    assert entity.value_raw == 0
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from binascii import Error as BinasciiError
 from typing import TYPE_CHECKING
-from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock
 from uuid import uuid4
+from zipfile import ZipFile
 
+import pytest
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from custom_components.homeconnect_ws import config_flow
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
     CONF_PSK,
     DOMAIN,
 )
-from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_USER
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE, CONF_DEVICE_ID, CONF_HOST, CONF_NAME
+from custom_components.homeconnect_ws.storage import ProfileCache, async_load_description
+from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_IMPORT, SOURCE_USER
+from homeassistant.const import CONF_DEVICE, CONF_DEVICE_ID, CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.selector import SelectOptionDict
 from homeconnect_websocket import ParserError
@@ -36,7 +42,9 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    import pytest
+    from pathlib import Path
+    from typing import IO
+
     from homeassistant.core import HomeAssistant
 
 UPLOADED_FILE = str(uuid4())
@@ -81,6 +89,7 @@ async def test_user_init(
             value=MOCK_TLS_DEVICE_ID_2,
             label="Test_Brand Test_TLS (Test_vib)",
         ),
+        SelectOptionDict(value="all", label="All Appliances"),
     ]
 
     hass.config_entries.flow.async_abort(result["flow_id"])
@@ -136,7 +145,7 @@ async def test_user_tls(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == {
+    assert await async_load_description(hass, result["data"][CONF_DESCRIPTION_HASH]) == {
         "info": MOCK_TLS_DEVICE_INFO,
         "MOCK_TLS_DEVICE_DESCRIPTION": None,
     }
@@ -198,7 +207,7 @@ async def test_user_aes(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == {
+    assert await async_load_description(hass, result["data"][CONF_DESCRIPTION_HASH]) == {
         "info": MOCK_AES_DEVICE_INFO,
         "MOCK_AES_DEVICE_DESCRIPTION": None,
     }
@@ -248,10 +257,132 @@ async def test_user_select_device(
             value=MOCK_TLS_DEVICE_ID_2,
             label="Test_Brand Test_TLS (Test_vib)",
         ),
+        SelectOptionDict(value="all", label="All Appliances"),
     ]
     hass.config_entries.flow.async_abort(result["flow_id"])
 
 
+async def test_user_add_all(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test adding all Appliances in one flow."""
+    appliances: list[MockAppliance] = []
+
+    def create_appliance(description: dict, *args, **kwargs) -> MockAppliance:  # noqa: ANN002, ANN003
+        appliance = MockAppliance(description["info"])(description, *args, **kwargs)
+        if appliance.iv64:
+            appliance._connect.side_effect = TimeoutError
+        appliances.append(appliance)
+        return appliance
+
+    monkeypatch.setattr(config_flow, "HomeAppliance", create_appliance)
+    # Ignored Appliances are added too
+    MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+        source=SOURCE_IGNORE,
+    ).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device_select"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_DEVICE: "all",
+        },
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    assert result["step_id"] == "add_all"
+    result = await hass.config_entries.flow.async_configure(result["flow_id"])
+
+    assert len(appliances) == 3
+    for appliance in appliances:
+        appliance._close.assert_awaited_once()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "add_all_finished"
+    assert result["description_placeholders"] == {
+        "added": "Test_Brand Test_TLS (Test_vib), Test_Brand Test_TLS (Test_vib)",
+        "failed": "Test_Brand Test_AES (Test_vib)",
+    }
+
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert {entry.unique_id for entry in entries} == {MOCK_TLS_DEVICE_ID, MOCK_TLS_DEVICE_ID_2}
+    for entry in entries:
+        assert entry.title == "Test_Brand Test_TLS"
+        assert entry.data[CONF_PSK] == MOCK_TLS_DEVICE_INFO["key"]
+        assert CONF_DEVICE not in entry.data
+        assert entry.source == SOURCE_IMPORT
+    assert mock_setup_entry.await_count == 2
+
+
+async def test_user_add_all_closed(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test closing the flow cancels adding all Appliances."""
+    appliances: list[MockAppliance] = []
+
+    def create_appliance(description: dict, *args, **kwargs) -> MockAppliance:  # noqa: ANN002, ANN003
+        appliance = MockAppliance(description["info"])(description, *args, **kwargs)
+        appliance._connect.side_effect = asyncio.Event().wait
+        appliances.append(appliance)
+        return appliance
+
+    monkeypatch.setattr(config_flow, "HomeAppliance", create_appliance)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_FILE: UPLOADED_FILE}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_DEVICE: "all"}
+    )
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    await asyncio.sleep(0)
+    assert appliances
+
+    hass.config_entries.flow.async_abort(result["flow_id"])
+    await hass.async_block_till_done()
+
+    for appliance in appliances:
+        appliance._close.assert_awaited_once()
+    assert not hass.config_entries.async_entries(DOMAIN)
+    mock_setup_entry.assert_not_awaited()
+
+
+async def test_user_step_device(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test the user step doesn't create entries from user input."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_USER},
+        data={CONF_DEVICE: MOCK_TLS_DEVICE_ID, **MOCK_CONFIG_DATA},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "upload"
+    mock_setup_entry.assert_not_awaited()
+
+
 async def test_user_select_device_one(
     hass: HomeAssistant,
     mock_process_profile_file: MagicMock,  # noqa: ARG001
@@ -294,7 +425,7 @@ async def test_user_select_device_one(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == {
+    assert await async_load_description(hass, result["data"][CONF_DESCRIPTION_HASH]) == {
         "info": MOCK_AES_DEVICE_INFO,
         "MOCK_AES_DEVICE_DESCRIPTION": None,
     }
@@ -347,6 +478,7 @@ async def test_user_select_device_ignore(
             value=MOCK_TLS_DEVICE_ID_2,
             label="Test_Brand Test_TLS (Test_vib)",
         ),
+        SelectOptionDict(value="all", label="All Appliances"),
     ]
     hass.config_entries.flow.async_abort(result["flow_id"])
 
@@ -720,7 +852,13 @@ async def test_process_profile(
     mock_process_uploaded_file: MagicMock,
 ) -> None:
     """Test processing profile file."""
-    mock_parser = MagicMock()
+    parsed_files = []
+
+    def parse_files(description_file: IO[bytes], feature_file: IO[bytes]) -> None:
+        parsed_files.append((description_file.read(), feature_file.read()))
+
+    mock_parser = MagicMock(side_effect=parse_files)
+    mock_parser.return_value = None
     monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
 
     mock_config_flow = AsyncMock()
@@ -740,11 +878,62 @@ async def test_process_profile(
         },
     }
 
-    mock_parser.assert_has_calls(
-        [
-            call(b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
-            call(b"AES_DeviceDescription", b"AES_FeatureMapping"),
-        ],
-        any_order=True,
-    )
+    assert sorted(parsed_files) == [
+        (b"AES_DeviceDescription", b"AES_FeatureMapping"),
+        (b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
+    ]
     mock_process_uploaded_file.assert_called_with(ANY, UPLOADED_FILE)
+
+
+def test_process_zip_file_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, create_profile_file: Path
+) -> None:
+    """Test parsed descriptions are cached."""
+    mock_parser = Mock(
+        side_effect=lambda description, _: {"description": description.read().decode()}
+    )
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    profile_cache = ProfileCache(tmp_path / "cache")
+
+    result = config_flow.process_zip_file(create_profile_file, profile_cache)
+    assert mock_parser.call_count == 2
+
+    cached_result = config_flow.process_zip_file(create_profile_file, profile_cache)
+    assert mock_parser.call_count == 2
+    assert cached_result == result
+    assert cached_result[MOCK_TLS_DEVICE_ID]["description"] == {
+        "description": "TLS_DeviceDescription"
+    }
+
+
+def test_process_zip_file_skip_other_json(
+    monkeypatch: pytest.MonkeyPatch, create_profile_file: Path
+) -> None:
+    """Test json files without Appliance info are ignored."""
+    with ZipFile(create_profile_file, mode="a") as file:
+        file.writestr("metadata.json", json.dumps({"version": 1}))
+    monkeypatch.setattr(config_flow, "parse_device_description", Mock(return_value={}))
+
+    result = config_flow.process_zip_file(create_profile_file)
+    assert list(result) == [MOCK_TLS_DEVICE_ID, MOCK_AES_DEVICE_ID]
+
+
+@pytest.mark.parametrize(
+    ("member_size", "total_size"),
+    [(10, 1000), (1000, 40)],
+)
+def test_process_zip_file_size_limit(
+    monkeypatch: pytest.MonkeyPatch,
+    create_profile_file: Path,
+    member_size: int,
+    total_size: int,
+) -> None:
+    """Test profile files exceeding the size limits are rejected."""
+    mock_parser = Mock(return_value={})
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    monkeypatch.setattr(config_flow, "MAX_PROFILE_MEMBER_SIZE", member_size)
+    monkeypatch.setattr(config_flow, "MAX_PROFILE_SIZE", total_size)
+
+    with pytest.raises(ValueError, match="size limit"):
+        config_flow.process_zip_file(create_profile_file)
+    mock_parser.assert_not_called()
@@ -84,6 +84,51 @@ def test_get_available_entities(
     ]
 
 
+MOCK_ALIASED_ENTITY_DESCRIPTIONS = {
+    "binary_sensor": [
+        HCBinarySensorEntityDescription(
+            key="binary_sensor_alias",
+            entity="Test.BinarySensor2",
+            entity_aliases=("Test.BinarySensor3", "Test.BinarySensor"),
+        ),
+        HCBinarySensorEntityDescription(
+            key="binary_sensor_primary",
+            entity="Test.BinarySensor",
+            entity_aliases=("Test.Event1",),
+        ),
+        HCBinarySensorEntityDescription(
+            key="binary_sensor_no_alias",
+            entity="Test.BinarySensor2",
+            entity_aliases=("Test.BinarySensor3",),
+        ),
+    ],
+}
+
+
+def test_get_available_entities_aliases(
+    mock_appliance: MockAppliance, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test get_available_entities with entity aliases."""
+    monkeypatch.setattr(
+        entity_descriptions,
+        "get_all_entity_description",
+        Mock(return_value=MOCK_ALIASED_ENTITY_DESCRIPTIONS),
+    )
+    entities = entity_descriptions.get_available_entities(mock_appliance)
+    assert entities["binary_sensor"] == [
+        HCBinarySensorEntityDescription(
+            key="binary_sensor_alias",
+            entity="Test.BinarySensor",
+            entity_aliases=("Test.BinarySensor3", "Test.BinarySensor"),
+        ),
+        HCBinarySensorEntityDescription(
+            key="binary_sensor_primary",
+            entity="Test.BinarySensor",
+            entity_aliases=("Test.Event1",),
+        ),
+    ]
+
+
 POWER_SWITCH = {
     "setting": [
         {
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from copy import deepcopy
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components.homeconnect_ws import coordinator
 from homeassistant.components.fan import (
     ATTR_PERCENTAGE,
     ATTR_PERCENTAGE_STEP,
     SERVICE_SET_PERCENTAGE,
+    SERVICE_TURN_OFF,
     FanEntityFeature,
 )
 from homeassistant.components.fan import DOMAIN as FAN_DOMAIN
@@ -19,13 +24,14 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeconnect_websocket.message import Action, Message
+from homeconnect_websocket.testutils import MockAppliance
 
 from . import setup_config_entry
-from .const import MOCK_CONFIG_DATA
+from .const import DEVICE_DESCRIPTION, MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
-    from homeconnect_websocket.testutils import MockAppliance
 
 
 async def test_setup(
@@ -111,7 +117,8 @@ async def test_set_speed(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 403, "value": 1}, {"uid": 404, "value": 0}],
+            # Test.FanSpeed2 is already 0
+            data={"uid": 403, "value": 1},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -130,6 +137,159 @@ async def test_set_speed(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 403, "value": 0}, {"uid": 404, "value": 1}],
+            # Test.FanSpeed1 was not confirmed by the Appliance and is still 0
+            data={"uid": 404, "value": 1},
         )
     )
+
+
+async def test_set_speed_changed_only(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test only speed Entities with a changed value are sent."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    await mock_appliance.entities["Test.FanSpeed1"].update({"value": 1})
+    await mock_appliance.entities["Test.FanSpeed2"].update({"value": 0})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        FAN_DOMAIN,
+        SERVICE_SET_PERCENTAGE,
+        {ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan", ATTR_PERCENTAGE: 50},
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 403, "value": 2})
+    )
+    mock_appliance.session.send_sync.reset_mock()
+
+    await hass.services.async_call(
+        FAN_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan"},
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 403, "value": 0})
+    )
+    mock_appliance.session.send_sync.reset_mock()
+
+    await mock_appliance.entities["Test.FanSpeed1"].update({"value": 0})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        FAN_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan"},
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def test_set_speed_in_flight(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test restoring the speed while another speed is in flight."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    await mock_appliance.entities["Test.FanSpeed1"].update({"value": 1})
+    await mock_appliance.entities["Test.FanSpeed2"].update({"value": 0})
+    await hass.async_block_till_done()
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    change = hass.async_create_task(
+        hass.services.async_call(
+            FAN_DOMAIN,
+            SERVICE_SET_PERCENTAGE,
+            {ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan", ATTR_PERCENTAGE: 50},
+            blocking=True,
+        )
+    )
+    async with asyncio.timeout(1):
+        while not mock_appliance.session.send_sync.await_count:  # noqa: ASYNC110
+            await asyncio.sleep(0)
+
+    # The Appliance still reports the original speed
+    restore = hass.async_create_task(
+        hass.services.async_call(
+            FAN_DOMAIN,
+            SERVICE_SET_PERCENTAGE,
+            {ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan", ATTR_PERCENTAGE: 25},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(change, restore)
+
+    assert [call.args[0].data for call in mock_appliance.session.send_sync.await_args_list] == [
+        {"uid": 403, "value": 2},
+        {"uid": 403, "value": 1},
+    ]
+
+
+async def test_many_speeds(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a hood with many venting and intensive levels."""
+    venting_levels = 9
+    intensive_levels = 6
+    description = deepcopy(DEVICE_DESCRIPTION)
+    for option in description["option"]:
+        if option["name"] == "Test.FanSpeed1":
+            option["enumeration"] = {
+                str(level): f"Level{level}" for level in range(venting_levels + 1)
+            }
+        elif option["name"] == "Test.FanSpeed2":
+            option["enumeration"] = {
+                str(level): f"Level{level}" for level in range(intensive_levels + 1)
+            }
+    appliance = MockAppliance(description, "host", "mock_app", "mock_app_id", None)
+    appliance.session.connected = True
+    monkeypatch.setattr(coordinator, "HomeAppliance", Mock(return_value=appliance))
+    monkeypatch.setattr(coordinator.HomeConnectCoordinator, "connected", True)
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    venting = appliance.entities["Test.FanSpeed1"]
+    intensive = appliance.entities["Test.FanSpeed2"]
+    await venting.update({"value": 0})
+    await intensive.update({"value": 0})
+
+    speed_count = venting_levels + intensive_levels
+    for speed in range(1, speed_count + 1):
+        entity, value = (
+            (venting, speed) if speed <= venting_levels else (intensive, speed - venting_levels)
+        )
+        await hass.services.async_call(
+            FAN_DOMAIN,
+            SERVICE_SET_PERCENTAGE,
+            {
+                ATTR_ENTITY_ID: "fan.fake_brand_homeappliance_fan",
+                ATTR_PERCENTAGE: speed * 100 // speed_count,
+            },
+            blocking=True,
+        )
+
+        # Moving to the next level changes one Entity, switching to intensive two
+        data = {"uid": entity.uid, "value": value}
+        if speed == venting_levels + 1:
+            data = [{"uid": venting.uid, "value": 0}, data]
+        appliance.session.send_sync.assert_awaited_once_with(
+            Message(resource="/ro/values", action=Action.POST, data=data)
+        )
+        appliance.session.send_sync.reset_mock()
+
+        if speed == venting_levels + 1:
+            await venting.update({"value": 0})
+        await entity.update({"value": value})
+        await hass.async_block_till_done()
+        state = hass.states.get("fan.fake_brand_homeappliance_fan")
+        assert state.attributes[ATTR_PERCENTAGE] == speed * 100 // speed_count
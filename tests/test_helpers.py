@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import gc
 import re
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from custom_components.homeconnect_ws import helpers
+from custom_components.homeconnect_ws.entity_descriptions.common import generate_program
 from custom_components.homeconnect_ws.helpers import (
     EntityMatch,
+    compact_description,
+    copy_description,
     get_entities_from_regex,
     get_groups_from_regex,
+    get_referenced_entities,
+    intern_description,
 )
 
-from .const import DEVICE_DESCRIPTION
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS
+from .test_entity_descriptions import PROGRAM
 
 if TYPE_CHECKING:
     from homeconnect_websocket.testutils import MockApplianceType
@@ -36,3 +45,68 @@ async def test_get_groups_from_regex(mock_homeconnect_appliance: MockApplianceTy
     pattern = re.compile(r"^Test\.RegEx\.(.*)\..*$")
     result = get_groups_from_regex(appliance, pattern)
     assert result == {("001",), ("002",)}
+
+
+async def test_intern_description(mock_homeconnect_appliance: MockApplianceType) -> None:
+    """Test descriptions from identical appliances are shared and dropped when unused."""
+    pools = (helpers._INTERNED_DESCRIPTIONS, helpers._INTERNED_VALUES)
+    pool_sizes = [len(pool) for pool in pools]
+    appliance_1 = await mock_homeconnect_appliance(description=PROGRAM)
+    appliance_2 = await mock_homeconnect_appliance(description=PROGRAM)
+    descriptions_1 = generate_program(appliance_1)
+    descriptions_2 = generate_program(appliance_2)
+    assert descriptions_1["program"][0] is not descriptions_2["program"][0]
+
+    program_1 = intern_description(descriptions_1["program"][0])
+    program_2 = intern_description(descriptions_2["program"][0])
+    active_program = intern_description(descriptions_1["active_program"][0])
+    assert program_1 is program_2
+    assert program_1 == descriptions_1["program"][0]
+    assert isinstance(program_1.mapping, MappingProxyType)
+    assert program_1.mapping is active_program.mapping
+    # Program and active program share one mapping
+    assert [len(pool) for pool in pools] == [pool_sizes[0] + 2, pool_sizes[1] + 1]
+
+    del descriptions_1, descriptions_2, program_1, program_2, active_program
+    gc.collect()
+    assert [len(pool) for pool in pools] == pool_sizes
+
+
+def test_compact_description() -> None:
+    """Test reducing a description to the referenced entities."""
+    referenced_entities = get_referenced_entities(ENTITY_DESCRIPTIONS)
+    assert "Test.Program.Program1" in referenced_entities
+    assert "Test.LightingColor" in referenced_entities
+    assert "Test.RegEx.001.Sensor" not in referenced_entities
+
+    description = compact_description(DEVICE_DESCRIPTION, referenced_entities)
+    assert description["info"] is DEVICE_DESCRIPTION["info"]
+    assert description["activeProgram"] is DEVICE_DESCRIPTION["activeProgram"]
+    assert [entity["name"] for entity in description["status"]] == [
+        "Test.BinarySensor",
+        "Test.BinarySensor.Enum",
+        "Test.Sensor",
+        "Test.Sensor.Enum",
+    ]
+    # Favorite names and program options are kept
+    setting_names = [entity["name"] for entity in description["setting"]]
+    assert "BSH.Common.Setting.Favorite.001.Name" in setting_names
+    assert "Test.RegEx.001.Switch" not in setting_names
+    assert [entity["name"] for entity in description["option"]] == [
+        "Test.Option1",
+        "Test.Option2",
+        "Test.FanSpeed1",
+        "Test.FanSpeed2",
+    ]
+    assert description["program"] == DEVICE_DESCRIPTION["program"]
+
+
+def test_copy_description() -> None:
+    """Test copying a description only copies the info."""
+    description = copy_description(DEVICE_DESCRIPTION)
+    assert description == DEVICE_DESCRIPTION
+    assert description["info"] is not DEVICE_DESCRIPTION["info"]
+    assert description["setting"] is DEVICE_DESCRIPTION["setting"]
+
+    description["info"]["vib"] = "Other_vib"
+    assert DEVICE_DESCRIPTION["info"]["vib"] != "Other_vib"
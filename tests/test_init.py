@@ -5,15 +5,32 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, Mock
 
-from custom_components.homeconnect_ws import coordinator
-from custom_components.homeconnect_ws.const import DOMAIN
-from homeassistant.config_entries import ConfigEntryState
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws import coordinator, sensor
+from custom_components.homeconnect_ws.const import (
+    CONF_COMPACT_DESCRIPTION,
+    CONF_DESCRIPTION_COMPACTED,
+    CONF_DESCRIPTION_HASH,
+    DOMAIN,
+)
+from custom_components.homeconnect_ws.storage import (
+    STORAGE_KEY,
+    async_load_description,
+    async_save_description,
+)
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.const import CONF_DESCRIPTION, Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
 from homeconnect_websocket.testutils import MockAppliance
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from .const import DEVICE_DESCRIPTION, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
 
 if TYPE_CHECKING:
+    from typing import Any
+
     import pytest
     from homeassistant.core import HomeAssistant
 
@@ -55,3 +72,203 @@ async def test_load_unload_entry(
     assert entry.state is ConfigEntryState.NOT_LOADED
 
     appliance.session.close.assert_awaited_once()
+
+
+async def test_skip_disabled_entities(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test entities disabled in the entity registry are not created."""
+    sensor_class = Mock(wraps=sensor.HCSensor)
+    monkeypatch.setattr(sensor, "HCSensor", sensor_class)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    entity_registry.async_get_or_create(
+        SENSOR_DOMAIN,
+        DOMAIN,
+        "Fake_deviceID-Test.Sensor",
+        config_entry=entry,
+        suggested_object_id="fake_brand_homeappliance_sensor",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor") is None
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor_enum")
+    assert [
+        mock_call.kwargs["entity_description"].key for mock_call in sensor_class.call_args_list
+    ] == ["Test.Sensor.Enum"]
+
+
+async def test_forward_used_platforms(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+) -> None:
+    """Test only platforms with entities are set up."""
+    monkeypatch.setattr(
+        homeconnect_ws,
+        "get_available_entities",
+        Mock(return_value={"sensor": ENTITY_DESCRIPTIONS["sensor"], "fan": [], "switch": []}),
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.platforms == [Platform.BINARY_SENSOR, Platform.SENSOR]
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor")
+    assert hass.states.get("binary_sensor.fake_brand_homeappliance_connection")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_migrate_entry(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test migrating a config entry from version 1.1."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=1,
+        minor_version=1,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.version == 2
+    assert entry.minor_version == 1
+    assert entry.data[CONF_DESCRIPTION_COMPACTED] is False
+    assert CONF_DESCRIPTION not in entry.data
+    assert (
+        await async_load_description(hass, entry.data[CONF_DESCRIPTION_HASH]) == DEVICE_DESCRIPTION
+    )
+
+
+async def test_migrate_future_version(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test config entries of a newer version are refused."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=3,
+        minor_version=1,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.MIGRATION_ERROR
+    assert entry.version == 3
+
+
+async def test_compact_description(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test compacting the stored description."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG_DATA, CONF_DESCRIPTION_COMPACTED: False},
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=1,
+        minor_version=2,
+    )
+    full_description_hash = await async_save_description(hass, DEVICE_DESCRIPTION)
+    entry.add_to_hass(hass)
+
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {CONF_COMPACT_DESCRIPTION: True}})
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.data[CONF_DESCRIPTION_COMPACTED] is True
+    assert entry.data[CONF_DESCRIPTION_HASH] != full_description_hash
+    assert f"{STORAGE_KEY}.{full_description_hash}" not in hass_storage
+    description = await async_load_description(hass, entry.data[CONF_DESCRIPTION_HASH])
+    setting_names = [entity["name"] for entity in description["setting"]]
+    assert "Test.Switch" in setting_names
+    assert "Test.RegEx.001.Switch" not in setting_names
+
+
+async def test_missing_description(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test setup with a missing stored description starts reauth."""
+    data = {**MOCK_CONFIG_DATA, CONF_DESCRIPTION_COMPACTED: False, CONF_DESCRIPTION_HASH: "0"}
+    data.pop(CONF_DESCRIPTION)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=2,
+        minor_version=1,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 1
+    assert flows[0]["context"]["source"] == SOURCE_REAUTH
+
+
+async def test_remove_entry(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test removing a config entry removes its stored description."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage_key = f"{STORAGE_KEY}.{entry.data[CONF_DESCRIPTION_HASH]}"
+    assert storage_key in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert storage_key not in hass_storage
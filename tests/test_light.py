@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components.homeconnect_ws import light
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_BRIGHTNESS_PCT,
@@ -30,10 +33,22 @@ from . import setup_config_entry
 from .const import MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
     from homeconnect_websocket.testutils import MockAppliance
 
 
+def _confirm_writes(mock_appliance: MockAppliance) -> None:
+    """Let the Appliance confirm written values, like it does with a NOTIFY."""
+
+    async def send_sync(message: Message) -> None:
+        values = message.data if isinstance(message.data, list) else [message.data]
+        for value in values:
+            await mock_appliance.entities_uid[value["uid"]].update({"value": value["value"]})
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+
+
 async def test_setup(
     hass: HomeAssistant,
     mock_appliance: MockAppliance,
@@ -117,7 +132,7 @@ async def test_on(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 108, "value": True}],
+            data={"uid": 108, "value": True},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -163,6 +178,7 @@ async def test_set_brightness(
     patch_entity_description: None,  # noqa: ARG001
 ) -> None:
     """Test Brightness."""
+    _confirm_writes(mock_appliance)
     assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
     await mock_appliance.entities["Test.Lighting"].update({"value": True})
     await mock_appliance.entities["Test.LightingBrightness"].update({"value": 2})
@@ -181,7 +197,7 @@ async def test_set_brightness(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 109, "value": 100}],
+            data={"uid": 109, "value": 100},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -200,7 +216,7 @@ async def test_set_brightness(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 109, "value": 50}],
+            data={"uid": 109, "value": 50},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -219,7 +235,7 @@ async def test_set_brightness(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 109, "value": 2}],
+            data={"uid": 109, "value": 2},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -234,13 +250,8 @@ async def test_set_brightness(
         blocking=True,
     )
 
-    mock_appliance.session.send_sync.assert_awaited_once_with(
-        Message(
-            resource="/ro/values",
-            action=Action.POST,
-            data=[{"uid": 109, "value": 2}],
-        )
-    )
+    # Clamped to the minimum, which is the current brightness
+    mock_appliance.session.send_sync.assert_not_awaited()
     mock_appliance.session.send_sync.reset_mock()
 
 
@@ -281,6 +292,7 @@ async def test_set_color_temp(
     patch_entity_description: None,  # noqa: ARG001
 ) -> None:
     """Test Color temp."""
+    _confirm_writes(mock_appliance)
     mock_appliance.entities.pop("Cooking.Hood.Setting.ColorTemperature")
     assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
     await mock_appliance.entities["Test.Lighting"].update({"value": True})
@@ -301,7 +313,7 @@ async def test_set_color_temp(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 100}],
+            data={"uid": 110, "value": 100},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -320,7 +332,7 @@ async def test_set_color_temp(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 0}],
+            data={"uid": 110, "value": 0},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -339,7 +351,7 @@ async def test_set_color_temp(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 50}],
+            data={"uid": 110, "value": 50},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -446,6 +458,7 @@ async def test_set_color_temp_inverted(
     patch_entity_description: None,  # noqa: ARG001
 ) -> None:
     """Test Color temp."""
+    _confirm_writes(mock_appliance)
     assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
     await mock_appliance.entities["Test.Lighting"].update({"value": True})
     await mock_appliance.entities["Test.LightingBrightness"].update({"value": 100})
@@ -465,7 +478,7 @@ async def test_set_color_temp_inverted(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 0}],
+            data={"uid": 110, "value": 0},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -484,7 +497,7 @@ async def test_set_color_temp_inverted(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 100}],
+            data={"uid": 110, "value": 100},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -503,7 +516,7 @@ async def test_set_color_temp_inverted(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 110, "value": 50}],
+            data={"uid": 110, "value": 50},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -538,7 +551,6 @@ async def test_set_brightness_color_temp_inverted(
             action=Action.POST,
             data=[
                 {"uid": 109, "value": 100},
-                {"uid": 110, "value": 0},
                 {"uid": 108, "value": True},
             ],
         )
@@ -624,7 +636,7 @@ async def test_set_color(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 111, "value": "#7f0000"}],
+            data={"uid": 111, "value": "#7f0000"},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -643,7 +655,7 @@ async def test_set_color(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 111, "value": "#00ff00"}],
+            data={"uid": 111, "value": "#00ff00"},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -663,7 +675,7 @@ async def test_set_color(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 111, "value": "#008000"}],
+            data={"uid": 111, "value": "#008000"},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -685,7 +697,7 @@ async def test_set_color(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 111, "value": "#000080"}],
+            data={"uid": 111, "value": "#000080"},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
@@ -702,11 +714,102 @@ async def test_set_color(
         },
         blocking=True,
     )
+    # Only the color mode is sent, the color is unchanged
     mock_appliance.session.send_sync.assert_awaited_once_with(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 111, "value": "#800000"}, {"uid": 112, "value": 1}],
+            data={"uid": 112, "value": 1},
         )
     )
     mock_appliance.session.send_sync.reset_mock()
+
+
+async def test_dim_color(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test dimming a RGB light sends only the color, parsed colors are cached."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    await mock_appliance.entities["Test.Lighting"].update({"value": True})
+    await mock_appliance.entities["Test.LightingCustomColor"].update({"value": "#ff0000"})
+    await mock_appliance.entities["Test.LightingColor"].update({"value": 1})
+    await hass.async_block_till_done()
+    rgb_hex_to_rgb_list = Mock(wraps=light.rgb_hex_to_rgb_list)
+    monkeypatch.setattr(light, "rgb_hex_to_rgb_list", rgb_hex_to_rgb_list)
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: "light.fake_brand_homeappliance_light_4",
+            ATTR_BRIGHTNESS_PCT: 50,
+        },
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data={"uid": 111, "value": "#800000"},
+        )
+    )
+    rgb_hex_to_rgb_list.assert_not_called()
+
+    await mock_appliance.entities["Test.LightingCustomColor"].update({"value": "#800000"})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("light.fake_brand_homeappliance_light_4")
+    assert state.attributes[ATTR_BRIGHTNESS] == 128
+    assert state.attributes[ATTR_RGB_COLOR] == (255, 0, 0)
+    rgb_hex_to_rgb_list.assert_called_once_with("800000")
+
+
+async def test_set_brightness_in_flight(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test restoring the brightness while another brightness is in flight."""
+    entity_id = "light.fake_brand_homeappliance_light_2"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    await mock_appliance.entities["Test.Lighting"].update({"value": True})
+    await mock_appliance.entities["Test.LightingBrightness"].update({"value": 2})
+    await hass.async_block_till_done()
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    dim = hass.async_create_task(
+        hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: entity_id, ATTR_BRIGHTNESS_PCT: 50},
+            blocking=True,
+        )
+    )
+    async with asyncio.timeout(1):
+        while not mock_appliance.session.send_sync.await_count:  # noqa: ASYNC110
+            await asyncio.sleep(0)
+
+    # The Appliance still reports the original brightness
+    restore = hass.async_create_task(
+        hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: entity_id, ATTR_BRIGHTNESS_PCT: 2},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(dim, restore)
+
+    assert [call.args[0].data for call in mock_appliance.session.send_sync.await_args_list] == [
+        {"uid": 109, "value": 50},
+        {"uid": 109, "value": 2},
+    ]
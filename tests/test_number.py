@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+from custom_components.homeconnect_ws.const import CONF_OPTIMISTIC, DOMAIN
 from homeassistant.components.number import (
     ATTR_MAX,
     ATTR_MIN,
@@ -13,6 +15,8 @@ from homeassistant.components.number import (
 )
 from homeassistant.components.number import DOMAIN as NUMBER_DOMAIN
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
 from homeconnect_websocket.message import Action, Message
 
 from . import setup_config_entry
@@ -93,3 +97,52 @@ async def test_set_value(
             data={"uid": 204, "value": 2},
         )
     )
+
+
+async def test_set_value_invalid_step(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test setting a value that doesn't match the step fails without sending."""
+    entity_id = "number.fake_brand_homeappliance_number"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            NUMBER_DOMAIN,
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: "3"},
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "value_invalid_step"
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def test_optimistic_other_value(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test the optimistic value is rolled back when the Appliance notifies another value."""
+    entity_id = "number.fake_brand_homeappliance_number"
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {CONF_OPTIMISTIC: True}})
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    optimistic = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.optimistic
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    await hass.services.async_call(
+        NUMBER_DOMAIN,
+        SERVICE_SET_VALUE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: "6"},
+        blocking=True,
+    )
+    assert float(hass.states.get(entity_id).state) == 6
+
+    await entity.update({"value": 4})
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get(entity_id).state) == 4
+    assert optimistic.confirmed == 0
+    assert optimistic.rolled_back == 1
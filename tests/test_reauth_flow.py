@@ -11,10 +11,17 @@ from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from custom_components.homeconnect_ws import config_flow
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_COMPACTED,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_PSK,
     DOMAIN,
 )
+from custom_components.homeconnect_ws.storage import (
+    async_load_description,
+    async_save_description,
+)
+from homeassistant.const import CONF_DESCRIPTION
 from homeassistant.data_entry_flow import FlowResultType
 from homeconnect_websocket import ParserError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -75,6 +82,48 @@ async def test_reauth(
     mock_setup_entry.assert_awaited_once()
 
 
+async def test_reconfigure(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test a reconfigure flow restores a compacted description."""
+    appliance = MockAppliance(MOCK_AES_DEVICE_INFO)
+    monkeypatch.setattr(config_flow, "HomeAppliance", appliance)
+
+    data = {**MOCK_CONFIG_DATA, CONF_DESCRIPTION_COMPACTED: True}
+    data[CONF_DESCRIPTION_HASH] = await async_save_description(hass, data.pop(CONF_DESCRIPTION))
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        unique_id=MOCK_AES_DEVICE_ID,
+        version=2,
+        minor_version=1,
+    )
+    mock_config.add_to_hass(hass)
+
+    result = await mock_config.start_reconfigure_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "upload"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert "MOCK_AES_DEVICE_DESCRIPTION" in await async_load_description(
+        hass, mock_config.data[CONF_DESCRIPTION_HASH]
+    )
+    assert mock_config.data[CONF_DESCRIPTION_COMPACTED] is False
+    mock_setup_entry.assert_awaited_once()
+
+
 async def test_reauth_appliance_not_in_profile(
     hass: HomeAssistant,
     mock_process_profile_file: MagicMock,  # noqa: ARG001
@@ -0,0 +1,172 @@
+"""Tests for entity reconciler."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws import entity_descriptions
+from custom_components.homeconnect_ws.const import DOMAIN
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.helpers import entity_registry as er
+from homeconnect_websocket import ConnectionState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .const import ENTITY_DESCRIPTIONS, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def _setup_entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_reconcile(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test only changed entities are added and removed."""
+    entry = await _setup_entry(hass)
+    reconciler = entry.runtime_data.reconciler
+    switch = hass.data["entity_components"]["switch"].get_entity(
+        "switch.fake_brand_homeappliance_switch"
+    )
+    sensor_entity_id = "sensor.fake_brand_homeappliance_sensor"
+    enum_sensor_entity_id = "sensor.fake_brand_homeappliance_sensor_enum"
+    assert hass.states.get(enum_sensor_entity_id)
+
+    sensor_description = ENTITY_DESCRIPTIONS["sensor"][0]
+    entity_descriptions.get_available_entities.return_value = {
+        **ENTITY_DESCRIPTIONS,
+        "sensor": [replace(sensor_description, name="Renamed")],
+    }
+    await reconciler.async_reconcile()
+    await hass.async_block_till_done()
+
+    # Removed entity keeps its registry entry
+    assert hass.states.get(enum_sensor_entity_id).state == STATE_UNAVAILABLE
+    assert entity_registry.async_get(enum_sensor_entity_id)
+    # Changed entity keeps its entity_id
+    assert hass.states.get(sensor_entity_id).name == "Fake_brand HomeAppliance Renamed"
+    # Unchanged entity is untouched
+    assert (
+        hass.data["entity_components"]["switch"].get_entity(
+            "switch.fake_brand_homeappliance_switch"
+        )
+        is switch
+    )
+
+    entity_descriptions.get_available_entities.return_value = ENTITY_DESCRIPTIONS
+    await reconciler.async_reconcile()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(enum_sensor_entity_id).state != STATE_UNAVAILABLE
+    assert hass.states.get(sensor_entity_id).name == "Fake_brand HomeAppliance Sensor"
+    assert entry.runtime_data.available_entity_descriptions is ENTITY_DESCRIPTIONS
+
+
+async def test_reconnect_unchanged(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a reconnect with an unchanged description keeps entities and registry entries."""
+    entry = await _setup_entry(hass)
+    entity_registry.async_update_entity(
+        "switch.fake_brand_homeappliance_switch", name="My Switch", area_id="kitchen"
+    )
+    entity_registry.async_update_entity(
+        "sensor.fake_brand_homeappliance_sensor",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    registry_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    switch = hass.data["entity_components"]["switch"].get_entity(
+        "switch.fake_brand_homeappliance_switch"
+    )
+
+    await entry.runtime_data.coordinator._connection_state_callback(ConnectionState.CONNECTED)
+    await hass.async_block_till_done()
+
+    assert er.async_entries_for_config_entry(entity_registry, entry.entry_id) == registry_entries
+    assert (
+        hass.data["entity_components"]["switch"].get_entity(
+            "switch.fake_brand_homeappliance_switch"
+        )
+        is switch
+    )
+
+    # A partial description after a reconnect only removes the live entities
+    entity_descriptions.get_available_entities.return_value = {
+        **ENTITY_DESCRIPTIONS,
+        "switch": [],
+        "sensor": [],
+    }
+    await entry.runtime_data.coordinator._connection_state_callback(ConnectionState.CONNECTED)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("switch.fake_brand_homeappliance_switch").state == STATE_UNAVAILABLE
+    assert er.async_entries_for_config_entry(entity_registry, entry.entry_id) == registry_entries
+
+
+async def test_reconcile_new_platform(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+) -> None:
+    """Test entry is reloaded when entities need a platform that is not set up."""
+    get_available_entities = Mock(return_value={"sensor": ENTITY_DESCRIPTIONS["sensor"]})
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", get_available_entities)
+    monkeypatch.setattr(entity_descriptions, "get_available_entities", get_available_entities)
+    entry = await _setup_entry(hass)
+
+    schedule_reload = Mock()
+    monkeypatch.setattr(hass.config_entries, "async_schedule_reload", schedule_reload)
+    await entry.runtime_data.reconciler.async_reconcile()
+    schedule_reload.assert_not_called()
+
+    get_available_entities.return_value = {
+        "sensor": ENTITY_DESCRIPTIONS["sensor"],
+        "switch": ENTITY_DESCRIPTIONS["switch"],
+    }
+    await entry.runtime_data.reconciler.async_reconcile()
+    schedule_reload.assert_called_once_with(entry.entry_id)
+
+
+async def test_reconcile_program_mapping(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a changed program mapping is applied without recreating the entity."""
+    entry = await _setup_entry(hass)
+    entity_id = "select.fake_brand_homeappliance_selectedprogram"
+    select = hass.data["entity_components"]["select"].get_entity(entity_id)
+
+    program_description = ENTITY_DESCRIPTIONS["program"][0]
+    mapping = {**program_description.mapping, "BSH.Common.Program.Favorite.002": "Renamed"}
+    entity_descriptions.get_available_entities.return_value = {
+        **ENTITY_DESCRIPTIONS,
+        "program": [replace(program_description, mapping=mapping)],
+    }
+    await entry.runtime_data.reconciler.async_reconcile()
+    await hass.async_block_till_done()
+
+    assert hass.data["entity_components"]["select"].get_entity(entity_id) is select
+    assert select.entity_description.mapping == mapping
+    assert "Renamed" in select.options
@@ -0,0 +1,117 @@
+"""Tests for request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.scheduler import (
+    Priority,
+    RequestScheduler,
+    get_entity_priority,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_priority_order(hass: HomeAssistant) -> None:
+    """Test waiting requests are sent by priority, then in arrival order."""
+    scheduler = RequestScheduler(hass, max_in_flight=1)
+    release = asyncio.Event()
+    sent = []
+
+    async def request(name: str) -> str:
+        sent.append(name)
+        await release.wait()
+        return name
+
+    tasks = [
+        hass.async_create_task(scheduler.async_send(priority, request, name))
+        for priority, name in (
+            (Priority.SETTING, "setting_1"),
+            (Priority.DIAGNOSTIC, "diagnostic"),
+            (Priority.SETTING, "setting_2"),
+            (Priority.PROGRAM, "program"),
+            (Priority.COMMAND, "command"),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert sent == ["setting_1"]
+    assert scheduler.in_flight == 1
+    assert scheduler.queue_depth == 4
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [
+        "setting_1",
+        "diagnostic",
+        "setting_2",
+        "program",
+        "command",
+    ]
+    assert sent == ["setting_1", "command", "program", "setting_2", "diagnostic"]
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth == 0
+    assert scheduler.stats[Priority.SETTING].requests == 2
+    assert scheduler.stats[Priority.SETTING].max_queued == 1
+    assert scheduler.stats[Priority.DIAGNOSTIC].max_wait > 0
+
+
+async def test_bounded_in_flight(hass: HomeAssistant) -> None:
+    """Test at most max_in_flight requests are sent at the same time."""
+    scheduler = RequestScheduler(hass, max_in_flight=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request() -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await asyncio.gather(*(scheduler.async_send(Priority.SETTING, request) for _ in range(6)))
+
+    assert max_in_flight == 2
+    assert scheduler.in_flight == 0
+
+
+async def test_errors_and_cancel(hass: HomeAssistant) -> None:
+    """Test failed and cancelled requests free their slot."""
+    scheduler = RequestScheduler(hass, max_in_flight=1)
+    release = asyncio.Event()
+
+    async def request() -> None:
+        await release.wait()
+        msg = "failed"
+        raise ValueError(msg)
+
+    running = hass.async_create_task(scheduler.async_send(Priority.SETTING, request))
+    waiting = hass.async_create_task(scheduler.async_send(Priority.SETTING, request))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    release.set()
+    with pytest.raises(ValueError, match="failed"):
+        await running
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "priority"),
+    [
+        ("BSH.Common.Command.AbortProgram", Priority.COMMAND),
+        ("BSH.Common.Setting.PowerState", Priority.COMMAND),
+        ("BSH.Common.Root.SelectedProgram", Priority.PROGRAM),
+        ("BSH.Common.Setting.ChildLock", Priority.SETTING),
+        ("BSH.Common.Option.StartInRelative", Priority.SETTING),
+    ],
+)
+def test_entity_priority(name: str, priority: Priority) -> None:
+    """Test priority of value writes."""
+    assert get_entity_priority(SimpleNamespace(name=name)) == priority
@@ -237,3 +237,29 @@ async def test_select_program(
             },
         )
     )
+
+
+async def test_program_rename_favorite(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test renaming a favorite updates the program select entity."""
+    entity_id = "select.fake_brand_homeappliance_selectedprogram"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+
+    await mock_appliance.entities["Test.SelectedProgram"].update({"value": 503})
+    await mock_appliance.entities["BSH.Common.Setting.Favorite.002.Name"].update(
+        {"value": "Renamed Favorite"}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == "Renamed Favorite"
+    assert state.attributes[ATTR_OPTIONS] == [
+        "Named Favorite",
+        "Renamed Favorite",
+        "test_program_program1",
+        "test_program_program2",
+        "test_program_program3",
+    ]
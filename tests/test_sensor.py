@@ -145,3 +145,31 @@ async def test_update_active_program(
 
     state = hass.states.get(entity_id)
     assert state.state == "Named Favorite"
+
+
+async def test_active_program_rename_favorite(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test renaming a favorite updates the active program entity."""
+    entity_id = "sensor.fake_brand_homeappliance_activeprogram"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+
+    await mock_appliance.entities["Test.ActiveProgram"].update({"value": 503})
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "favorite_002"
+
+    await mock_appliance.entities["BSH.Common.Setting.Favorite.002.Name"].update(
+        {"value": "Renamed Favorite"}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == "Renamed Favorite"
+    assert "Renamed Favorite" in state.attributes[ATTR_OPTIONS]
+    assert "favorite_002" not in state.attributes[ATTR_OPTIONS]
+
+    await mock_appliance.entities["BSH.Common.Setting.Favorite.002.Name"].update({"value": ""})
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "favorite_002"
@@ -0,0 +1,407 @@
+"""Tests for services."""
+
+from __future__ import annotations
+
+import asyncio
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+import voluptuous as vol
+from custom_components.homeconnect_ws import coordinator
+from custom_components.homeconnect_ws.const import DOMAIN
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeconnect_websocket import CodeResponsError
+from homeconnect_websocket.message import Action, Message
+from homeconnect_websocket.testutils import MockAppliance
+
+from . import setup_config_entry
+from .const import DEVICE_DESCRIPTION, MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import device_registry as dr
+
+
+async def _setup_device(hass: HomeAssistant, device_registry: dr.DeviceRegistry) -> str:
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    return device_registry.async_get_device(identifiers={(DOMAIN, "any")}).id
+
+
+async def test_start_program_with_options(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a Program is started with its Options in a single message."""
+    device_id = await _setup_device(hass, device_registry)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {
+            "device_id": device_id,
+            "program": "Test.Program.Program1",
+            "options": {"Test.Option1": "Value", "Test.FanSpeed1": "Off"},
+        },
+        blocking=True,
+    )
+
+    # Writing each Option before starting would take 3 messages
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/activeProgram",
+            action=Action.POST,
+            data={
+                "program": 500,
+                "options": [
+                    {"uid": 401, "value": "Value"},
+                    {"uid": 403, "value": 0},
+                    {"uid": 402, "value": None},
+                ],
+            },
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "translation_key"),
+    [
+        ({"program": "Test.Program.Unknown"}, "program_not_available"),
+        ({"options": {"Test.Switch": True}}, "option_not_available"),
+        ({"options": {"Test.Unknown": True}}, "option_not_available"),
+        ({"options": {"Test.FanSpeed1": "Speed3"}}, "value_not_in_enum"),
+    ],
+)
+async def test_start_program_invalid(  # noqa: PLR0913, PLR0917
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+    data: dict,
+    translation_key: str,
+) -> None:
+    """Test invalid Programs and Options fail without sending."""
+    device_id = await _setup_device(hass, device_registry)
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {"device_id": device_id, "program": "Test.Program.Program1", **data},
+            blocking=True,
+        )
+
+    assert exc_info.value.translation_key == translation_key
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def _setup_typed_option(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry, monkeypatch: pytest.MonkeyPatch
+) -> tuple[str, MockAppliance]:
+    # Integer Option without a reported value
+    description = deepcopy(DEVICE_DESCRIPTION)
+    for option in description["option"]:
+        if option["name"] == "Test.Option1":
+            option.update(protocolType="Integer", min=30, max=90, stepSize=5)
+    appliance = MockAppliance(description, "host", "mock_app", "mock_app_id", None)
+    appliance.session.connected = True
+    monkeypatch.setattr(coordinator, "HomeAppliance", Mock(return_value=appliance))
+    monkeypatch.setattr(coordinator.HomeConnectCoordinator, "connected", True)
+    return await _setup_device(hass, device_registry), appliance
+
+
+@pytest.mark.parametrize(
+    ("value", "translation_key", "placeholders"),
+    [
+        ("abc", "option_value_invalid", {"value": "abc", "option": "Test.Option1"}),
+        (None, "option_value_invalid", {"value": "None", "option": "Test.Option1"}),
+        ("95", "value_out_of_range", None),
+        (32, "value_invalid_step", None),
+    ],
+)
+async def test_start_program_option_type(  # noqa: PLR0913, PLR0917
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+    value: Any,
+    translation_key: str,
+    placeholders: dict[str, str] | None,
+) -> None:
+    """Test Option values are converted to the Option type before they are validated."""
+    device_id, appliance = await _setup_typed_option(hass, device_registry, monkeypatch)
+    assert appliance.entities["Test.Option1"].value_raw is None
+    await appliance.entities["Test.SelectedProgram"].update({"value": 500})
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {
+                "device_id": device_id,
+                "program": "Test.Program.Program1",
+                "options": {"Test.Option1": value},
+            },
+            blocking=True,
+        )
+
+    assert exc_info.value.translation_key == translation_key
+    if placeholders is not None:
+        assert exc_info.value.translation_placeholders == placeholders
+    appliance.session.send_sync.assert_not_awaited()
+
+    await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {
+            "device_id": device_id,
+            "program": "Test.Program.Program1",
+            "options": {"Test.Option1": "35"},
+        },
+        blocking=True,
+    )
+    message = appliance.session.send_sync.await_args.args[0]
+    assert {"uid": 401, "value": 35} in message.data["options"]
+
+
+async def test_start_program_not_selected(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test Options of a Program that isn't selected are converted, but not range checked."""
+    device_id, appliance = await _setup_typed_option(hass, device_registry, monkeypatch)
+    await appliance.entities["Test.SelectedProgram"].update({"value": 500})
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {
+                "device_id": device_id,
+                "program": "Test.Program.Program2",
+                "options": {"Test.Option1": "abc"},
+            },
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "option_value_invalid"
+
+    # Constraints of the selected Program don't apply to Program2
+    await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {
+            "device_id": device_id,
+            "program": "Test.Program.Program2",
+            "options": {"Test.Option1": "95"},
+        },
+        blocking=True,
+    )
+    message = appliance.session.send_sync.await_args.args[0]
+    assert message.data["program"] == 501
+    assert {"uid": 401, "value": 95} in message.data["options"]
+
+
+async def test_start_program_multiple_appliances(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a service call is run on all targeted Appliances concurrently."""
+    appliances = []
+    for index in range(2):
+        description = deepcopy(DEVICE_DESCRIPTION)
+        description["info"]["mac"] = f"00-00-00-00-00-0{index}"
+        description["info"]["deviceID"] = f"device_{index}"
+        appliance = MockAppliance(description, "host", "mock_app", "mock_app_id", None)
+        appliance.session.connected = True
+        appliances.append(appliance)
+    monkeypatch.setattr(coordinator, "HomeAppliance", Mock(side_effect=appliances))
+    monkeypatch.setattr(coordinator.HomeConnectCoordinator, "connected", True)
+    device_ids = []
+    for unique_id in ("appliance_1", "appliance_2"):
+        assert await setup_config_entry(hass, MOCK_CONFIG_DATA, unique_id)
+        device_ids.append(device_registry.async_get_device(identifiers={(DOMAIN, unique_id)}).id)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def mock_send_sync(error: Exception | None) -> Callable[[Message], Awaitable[None]]:
+        async def send_sync(_: Message) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if error:
+                raise error
+
+        return send_sync
+
+    appliances[0].session.send_sync.side_effect = mock_send_sync(None)
+    appliances[1].session.send_sync.side_effect = mock_send_sync(
+        CodeResponsError(400, "/ro/activeProgram")
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {"device_id": device_ids, "program": "Test.Program.Program1"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert max_in_flight == 2
+    for appliance in appliances:
+        appliance.session.send_sync.assert_awaited_once()
+    assert response.keys() == set(device_ids)
+    assert response[device_ids[0]]["success"] is True
+    assert response[device_ids[0]]["error"] is None
+    assert response[device_ids[0]]["duration"] > 0
+    assert response[device_ids[1]]["success"] is False
+    assert "Service start_program failed on" in caplog.text
+
+    # Callers without a response are told about failed Appliances
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {"device_id": device_ids, "program": "Test.Program.Program1"},
+            blocking=True,
+        )
+    assert exc_info.value.translation_key == "service_failed"
+    assert exc_info.value.translation_placeholders["service"] == "start_program"
+    assert appliances[0].session.send_sync.await_count == 2
+
+
+async def test_get_values(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test getting a snapshot of values and the changes since a version."""
+    device_id = await _setup_device(hass, device_registry)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_values",
+        {"device_id": device_id, "prefix": "Test.Switch"},
+        blocking=True,
+        return_response=True,
+    )
+    values = response[device_id]["values"]
+    assert values.keys() == {"Test.Switch", "Test.Switch.Enum"}
+    assert values["Test.Switch.Enum"] == {
+        "uid": 202,
+        "value": None,
+        "access": "readwrite",
+        "available": True,
+    }
+    version = response[device_id]["version"]
+    epoch = response[device_id]["epoch"]
+
+    await mock_appliance.entities["Test.Switch.Enum"].update({"value": 1})
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_values",
+        {"device_id": device_id, "since": version, "epoch": epoch},
+        blocking=True,
+        return_response=True,
+    )
+    assert response[device_id]["epoch"] == epoch
+    assert response[device_id]["version"] == version + 1
+    assert response[device_id]["values"] == {
+        "Test.Switch.Enum": {"uid": 202, "value": "On", "access": "readwrite", "available": True}
+    }
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+    # Versions of another epoch return all values
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_values",
+        {"device_id": device_id, "since": version, "epoch": "other"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response[device_id]["values"].keys() == mock_appliance.entities.keys()
+
+    # Versions restart on reload, the epoch changes
+    config_entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await mock_appliance.entities["Test.Switch.Enum"].update({"value": 0})
+    await mock_appliance.entities["Test.Switch.Enum"].update({"value": 1})
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_values",
+        {"device_id": device_id, "since": version, "epoch": epoch},
+        blocking=True,
+        return_response=True,
+    )
+    assert response[device_id]["epoch"] != epoch
+    assert response[device_id]["values"].keys() == mock_appliance.entities.keys()
+
+
+async def test_get_values_tracks_after_first_request(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test Entity updates are only tracked once values were requested."""
+    device_id = await _setup_device(hass, device_registry)
+    await mock_appliance.entities["Test.Switch.Enum"].update({"value": 1})
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN, "get_values", {"device_id": device_id}, blocking=True, return_response=True
+    )
+    assert response[device_id]["version"] == 0
+    epoch = response[device_id]["epoch"]
+
+    await mock_appliance.entities["Test.Switch.Enum"].update({"value": 0})
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_values",
+        {"device_id": device_id, "since": 0, "epoch": epoch},
+        blocking=True,
+        return_response=True,
+    )
+    assert response[device_id]["version"] == 1
+    assert response[device_id]["values"].keys() == {"Test.Switch.Enum"}
+
+
+@pytest.mark.parametrize("since", ["abc", -1])
+async def test_get_values_invalid_since(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+    since: Any,
+) -> None:
+    """Test an invalid version is rejected."""
+    device_id = await _setup_device(hass, device_registry)
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_values",
+            {"device_id": device_id, "since": since},
+            blocking=True,
+            return_response=True,
+        )
+    mock_appliance.session.send_sync.assert_not_awaited()
@@ -0,0 +1,66 @@
+"""Tests for storage."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from custom_components.homeconnect_ws.storage import (
+    PROFILE_CACHE_SUFFIX,
+    ProfileCache,
+    async_load_description,
+    async_save_description,
+)
+
+from .const import DEVICE_DESCRIPTION
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+
+async def test_description_store(hass: HomeAssistant) -> None:
+    """Test saving and loading a description."""
+    description_hash = await async_save_description(hass, DEVICE_DESCRIPTION)
+    assert description_hash == await async_save_description(hass, DEVICE_DESCRIPTION)
+    assert await async_load_description(hass, description_hash) == DEVICE_DESCRIPTION
+    assert await async_load_description(hass, "0") is None
+
+
+def test_profile_cache(tmp_path: Path) -> None:
+    """Test profile cache."""
+    cache = ProfileCache(tmp_path)
+    key = cache.get_key(b"DeviceDescription", b"FeatureMapping")
+    assert key != cache.get_key(b"DeviceDescription", b"FeatureMapping2")
+    assert cache.get(key) is None
+
+    cache.set(key, DEVICE_DESCRIPTION)
+    assert cache.get(key) == DEVICE_DESCRIPTION
+
+    # Invalid entries are removed
+    (tmp_path / f"{key}{PROFILE_CACHE_SUFFIX}").write_bytes(b"invalid")
+    assert cache.get(key) is None
+    assert not (tmp_path / f"{key}{PROFILE_CACHE_SUFFIX}").exists()
+
+
+def test_profile_cache_eviction(tmp_path: Path) -> None:
+    """Test profile cache evicts least recently used entries."""
+    cache = ProfileCache(tmp_path)
+    keys = [cache.get_key(str(index).encode(), b"FeatureMapping") for index in range(3)]
+    for index, key in enumerate(keys):
+        cache.set(key, {**DEVICE_DESCRIPTION, "index": index})
+        os.utime(tmp_path / f"{key}{PROFILE_CACHE_SUFFIX}", (index, index))
+    entry_size = (tmp_path / f"{keys[0]}{PROFILE_CACHE_SUFFIX}").stat().st_size
+
+    # Use first entry
+    assert cache.get(keys[0])["index"] == 0
+
+    cache = ProfileCache(tmp_path, max_size=int(entry_size * 2.5))
+    key = cache.get_key(b"3", b"FeatureMapping")
+    cache.set(key, {**DEVICE_DESCRIPTION, "index": 3})
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is None
+    assert cache.get(key) is not None
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+import pytest
+from custom_components.homeconnect_ws.const import CONF_OPTIMISTIC, DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -14,12 +18,18 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNKNOWN,
 )
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeconnect_websocket import CodeResponsError
 from homeconnect_websocket.message import Action, Message
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from . import setup_config_entry
 from .const import MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    from custom_components.homeconnect_ws import HCConfigEntry
     from homeassistant.core import HomeAssistant
     from homeconnect_websocket.testutils import MockAppliance
 
@@ -189,3 +199,176 @@ async def test_turn_off_enum(
             data={"uid": 202, "value": 0},
         )
     )
+
+
+async def test_turn_on_noop(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test turning on a switch that is already on sends nothing."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    await mock_appliance.entities["Test.Switch"].update({"value": True})
+
+    await hass.services.async_call(
+        domain=SWITCH_DOMAIN,
+        service=SERVICE_TURN_ON,
+        service_data={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def _setup_optimistic(hass: HomeAssistant) -> HCConfigEntry:
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {CONF_OPTIMISTIC: True}})
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA)
+    return hass.config_entries.async_entries(DOMAIN)[0]
+
+
+async def test_optimistic(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test optimistic state is shown while writing and confirmed by the Appliance."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    entry = await _setup_optimistic(hass)
+    states_while_writing = []
+
+    async def send_sync(_: Message) -> None:
+        states_while_writing.append(hass.states.get(entity_id).state)
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    await hass.services.async_call(
+        domain=SWITCH_DOMAIN,
+        service=SERVICE_TURN_ON,
+        service_data={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+
+    assert states_while_writing == [STATE_ON]
+    assert hass.states.get(entity_id).state == STATE_ON
+    assert entry.runtime_data.optimistic.pending == 0
+
+    await mock_appliance.entities["Test.Switch"].update({"value": True})
+    await hass.async_block_till_done()
+    assert entry.runtime_data.optimistic.confirmed == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON
+    assert entry.runtime_data.optimistic.rolled_back == 0
+
+
+async def test_optimistic_notify_unchanged(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test notifies without a value change keep the optimistic state."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    entry = await _setup_optimistic(hass)
+    entity = mock_appliance.entities["Test.Switch"]
+    await entity.update({"value": False})
+
+    await hass.services.async_call(
+        domain=SWITCH_DOMAIN,
+        service=SERVICE_TURN_ON,
+        service_data={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    await entity.update({"available": True})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == STATE_ON
+    assert entry.runtime_data.optimistic.confirmed == 0
+    assert entry.runtime_data.optimistic.rolled_back == 0
+
+    await entity.update({"value": True})
+    await hass.async_block_till_done()
+    assert entry.runtime_data.optimistic.confirmed == 1
+
+
+async def test_optimistic_rollback(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test optimistic state is rolled back when the write fails."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    entry = await _setup_optimistic(hass)
+
+    mock_appliance.session.send_sync.side_effect = CodeResponsError(400, "/ro/values")
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            domain=SWITCH_DOMAIN,
+            service=SERVICE_TURN_ON,
+            service_data={ATTR_ENTITY_ID: entity_id},
+            blocking=True,
+        )
+
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert entry.runtime_data.optimistic.pending == 0
+    assert entry.runtime_data.optimistic.rolled_back == 1
+
+
+async def test_optimistic_cancel(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test optimistic state is rolled back when the write is cancelled."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    entry = await _setup_optimistic(hass)
+    release = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        await release.wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    task = hass.async_create_task(
+        hass.services.async_call(
+            domain=SWITCH_DOMAIN,
+            service=SERVICE_TURN_ON,
+            service_data={ATTR_ENTITY_ID: entity_id},
+            blocking=True,
+        )
+    )
+    async with asyncio.timeout(1):
+        while not entry.runtime_data.optimistic.pending:  # noqa: ASYNC110
+            await asyncio.sleep(0)
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert entry.runtime_data.optimistic.pending == 0
+    assert entry.runtime_data.optimistic.rolled_back == 1
+
+
+async def test_optimistic_timeout(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test optimistic state is rolled back when the Appliance doesn't confirm it."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    entry = await _setup_optimistic(hass)
+
+    await hass.services.async_call(
+        domain=SWITCH_DOMAIN,
+        service=SERVICE_TURN_ON,
+        service_data={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert entry.runtime_data.optimistic.rolled_back == 1
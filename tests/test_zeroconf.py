@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from ipaddress import ip_address
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, Mock
 from uuid import uuid4
 
-from custom_components.homeconnect_ws import config_flow
+from custom_components.homeconnect_ws import HC_KEY, config_flow, discovery
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
     CONF_PSK,
     DOMAIN,
 )
+from custom_components.homeconnect_ws.storage import async_load_description
 from homeassistant.config_entries import SOURCE_ZEROCONF
 from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
@@ -26,6 +29,7 @@ from .const import (
     MOCK_CONFIG_DATA,
     MOCK_TLS_DEVICE_DESCRIPTION,
     MOCK_TLS_DEVICE_ID,
+    MOCK_TLS_DEVICE_ID_2,
     MOCK_TLS_DEVICE_INFO,
 )
 
@@ -100,7 +104,7 @@ async def test_zeroconf_init(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == {
+    assert await async_load_description(hass, result["data"][CONF_DESCRIPTION_HASH]) == {
         "info": MOCK_TLS_DEVICE_INFO,
         "MOCK_TLS_DEVICE_DESCRIPTION": None,
     }
@@ -155,6 +159,68 @@ async def test_zeroconf_update_host(
     mock_setup_entry.assert_not_awaited()
 
 
+async def test_zeroconf_throttle(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test repeated zeroconf announcements are collapsed."""
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    mock_config.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "discovery_throttled"
+
+    # Changed IP-Address is handled immediately
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_ZEROCONF},
+        data=replace(
+            MOCK_ZEROCONF_DATA,
+            ip_address=ip_address("127.0.0.3"),
+            ip_addresses=[ip_address("127.0.0.3")],
+        ),
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert mock_config.data[CONF_HOST] == "127.0.0.3"
+
+    discovery = hass.data[HC_KEY].discovery
+    assert discovery.received == 3
+    assert discovery.acted_on == 2
+    stats = discovery.get_stats(MOCK_TLS_DEVICE_ID)
+    assert stats.received == 3
+    assert stats.acted_on == 2
+    assert stats.host == "127.0.0.3"
+    mock_setup_entry.assert_not_awaited()
+
+
+def test_discovery_aggregator_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test announcements are acted on again after the window."""
+    monotonic = Mock(return_value=1000.0)
+    monkeypatch.setattr(discovery.time, "monotonic", monotonic)
+    aggregator = discovery.DiscoveryAggregator(window=60)
+
+    assert aggregator.async_process(MOCK_TLS_DEVICE_ID, "127.0.0.2")
+    monotonic.return_value = 1059.0
+    assert not aggregator.async_process(MOCK_TLS_DEVICE_ID, "127.0.0.2")
+    monotonic.return_value = 1060.0
+    assert aggregator.async_process(MOCK_TLS_DEVICE_ID, "127.0.0.2")
+    assert aggregator.async_process(MOCK_TLS_DEVICE_ID_2, "127.0.0.2")
+
+
 async def test_zeroconf_update_manual_host(
     hass: HomeAssistant,
     mock_setup_entry: AsyncMock,